@@ -30,9 +30,17 @@ Reference:
 from __future__ import annotations
 
 import asyncio
+import base64
+from collections import OrderedDict
+import hashlib
+import ipaddress
+import json
 import logging
+import socket
 import time
-from typing import Any
+from typing import Any, NewType
+
+import httpx
 
 from openmcp import MCPServer, tool
 from openmcp.server.authorization import (
@@ -46,18 +54,79 @@ from openmcp.server.authorization import (
 for logger_name in ("mcp", "httpx", "uvicorn", "uvicorn.access", "uvicorn.error"):
     logging.getLogger(logger_name).setLevel(logging.CRITICAL)
 
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover
+    orjson = None
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+ValidatedUrl = NewType("ValidatedUrl", httpx.URL)
+
+
+def _validate_endpoint(url: str) -> ValidatedUrl:
+    """Check the static parts of the introspection endpoint at configuration time.
+
+    Only the scheme is checked here; the host is vetted by
+    :meth:`TokenIntrospectionProvider._pin_endpoint` on every connection, since
+    an address resolved once at startup says nothing about later lookups.
+    """
+    parsed = httpx.URL(url)
+    if parsed.scheme != "https":
+        raise ValueError(f"introspection endpoint must use https: {url}")
+    return ValidatedUrl(parsed)
+
+
+def _is_public(address: ipaddress.IPv4Address | ipaddress.IPv6Address) -> bool:
+    # ``is_global`` also rejects CGNAT, reserved, unspecified and documentation
+    # ranges, but still admits multicast, which no HTTP endpoint lives on.
+    return address.is_global and not address.is_multicast
+
 
 class TokenIntrospectionProvider(AuthorizationProvider):
     """Production authorization provider using token introspection (RFC 7662).
 
     Implementation stub - production version would call real introspection endpoint.
+
+    Introspection results are held in a bounded LRU keyed by a BLAKE2b digest of
+    the token, so raw bearer tokens never live in the cache.  Concurrent
+    requests for the same uncached token share a single in-flight
+    introspection call.
     """
 
-    def __init__(self, introspection_endpoint: str, client_id: str, client_secret: str) -> None:
-        self.introspection_endpoint = introspection_endpoint
+    MAX_CACHE_ENTRIES = 10_000
+
+    def __init__(
+        self,
+        introspection_endpoint: str,
+        client_id: str,
+        client_secret: str,
+        *,
+        minimal: bool = True,
+        allow_private_endpoint: bool = False,
+    ) -> None:
+        self.introspection_endpoint = _validate_endpoint(introspection_endpoint)
+        self._allow_private_endpoint = allow_private_endpoint
         self.client_id = client_id
-        self.client_secret = client_secret
-        self._token_cache: dict[str, tuple[AuthorizationContext, float]] = {}
+        # Only active/scope/sub/exp are consumed, so ask the AS to skip
+        # userinfo claims (lightweight introspection) unless told otherwise.
+        self._form_extra = {"minimal": "true"} if minimal else {}
+        # Credentials are static: encode the Basic header once instead of per
+        # introspection call, and keep only the encoded form around.
+        credentials = base64.b64encode(f"{client_id}:{client_secret}".encode()).decode()
+        self._static_headers = {
+            "Authorization": f"Basic {credentials}",
+            "Content-Type": "application/x-www-form-urlencoded",
+        }
+        # One pooled client for the provider's lifetime so steady-state
+        # validations reuse warm TLS connections instead of handshaking per call.
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=30.0),
+            timeout=httpx.Timeout(5.0, connect=2.0),
+        )
+        self._token_cache: OrderedDict[bytes, tuple[AuthorizationContext, float]] = OrderedDict()
+        self._inflight: dict[bytes, asyncio.Future[AuthorizationContext]] = {}
 
     async def validate(self, token: str) -> AuthorizationContext:
         """Validate token via remote introspection endpoint.
@@ -69,36 +138,103 @@ class TokenIntrospectionProvider(AuthorizationProvider):
         4. Cache result with TTL
         5. Return AuthorizationContext or raise AuthorizationError
         """
+        key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+
         # Check cache
-        if token in self._token_cache:
-            ctx, expiry = self._token_cache[token]
-            if time.time() < expiry:
+        cached = self._token_cache.get(key)
+        if cached is not None:
+            ctx, expiry = cached
+            if time.monotonic() < expiry:
+                self._token_cache.move_to_end(key)
                 return ctx
+            del self._token_cache[key]
+
+        # Single-flight: piggyback on an introspection already in progress
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._introspect(key, token))
+            self._inflight[key] = inflight
+            inflight.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(inflight)
+
+    async def aclose(self) -> None:
+        """Release pooled introspection connections."""
+        await self._client.aclose()
 
-        # STUB: Simulated introspection response
+    async def _pin_endpoint(self) -> httpx.URL:
+        """Resolve the endpoint host and return a URL pinned to a vetted address.
+
+        Basic SSRF guard: unless ``allow_private_endpoint`` is set, every
+        resolved address must be public.  Resolution failures fail closed, and
+        the request connects to the address that was checked (the original
+        host still drives ``Host`` and TLS verification), so a DNS answer that
+        changes between check and connect cannot redirect it.
+        """
+        endpoint = self.introspection_endpoint
+        loop = asyncio.get_running_loop()
+        try:
+            infos = await loop.getaddrinfo(endpoint.host, endpoint.port or 443, proto=socket.IPPROTO_TCP)
+        except OSError as exc:
+            raise AuthorizationError(f"cannot resolve introspection endpoint {endpoint.host}") from exc
+        addresses = [ipaddress.ip_address(info[4][0]) for info in infos]
+        if not addresses:
+            raise AuthorizationError(f"cannot resolve introspection endpoint {endpoint.host}")
+        if not self._allow_private_endpoint:
+            for address in addresses:
+                if not _is_public(address):
+                    raise AuthorizationError(f"introspection endpoint resolves to non-public address {address}")
+        return endpoint.copy_with(host=str(addresses[0]))
+
+    async def _request_introspection(self, token: str) -> dict[str, Any]:
+        # STUB: Simulated introspection response for demo tokens
         if token.startswith("valid-"):
-            introspection = {
-                "active": True,
-                "scope": "mcp:read mcp:write",
-                "sub": "user-123",
-                "exp": int(time.time()) + 3600,
-            }
-        else:
-            introspection = {"active": False}
+            return {"active": True, "scope": "mcp:read mcp:write", "sub": "user-123", "exp": int(time.time()) + 3600}
+
+        host = self.introspection_endpoint.host
+        pinned = await self._pin_endpoint()
+        try:
+            response = await self._client.post(
+                pinned,
+                data={"token": token, "token_type_hint": "access_token", **self._form_extra},
+                headers={**self._static_headers, "Host": host},
+                extensions={"sni_hostname": host},
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as exc:
+            raise AuthorizationError(f"Token introspection failed: {exc}") from exc
+        try:
+            introspection = _loads(response.content)
+        except ValueError as exc:  # both JSON decoders raise ValueError subclasses
+            raise AuthorizationError("Token introspection returned invalid JSON") from exc
+        if not isinstance(introspection, dict):
+            raise AuthorizationError("Token introspection response is not a JSON object")
+        return introspection
+
+    async def _introspect(self, key: bytes, token: str) -> AuthorizationContext:
+        introspection = await self._request_introspection(token)
 
         if not introspection.get("active"):
             raise AuthorizationError("Token is not active")
 
         # Extract context
+        exp = introspection.get("exp")
+        # RFC 7662 defines ``exp`` as a NumericDate; anything else (including a
+        # JSON boolean, which Python treats as an int) is a malformed response.
+        if exp is not None and (isinstance(exp, bool) or not isinstance(exp, (int, float))):
+            raise AuthorizationError("Introspection response has a non-numeric exp")
         ctx = AuthorizationContext(
             subject=introspection.get("sub"),
-            scopes=introspection.get("scope", "").split(),
-            claims={"exp": introspection.get("exp")},
+            scopes=(introspection.get("scope") or "").split(),
+            claims={"exp": exp, "client_id": introspection.get("client_id"), "username": introspection.get("username")},
         )
 
-        # Cache with TTL
-        cache_ttl = min(introspection["exp"] - int(time.time()), 300)
-        self._token_cache[token] = (ctx, time.time() + cache_ttl)
+        # Cache with TTL, evicting least recently used entries past capacity.
+        # ``exp`` is wall-clock (and optional per RFC 7662), so convert it to
+        # time remaining exactly once and track expiry on the monotonic clock.
+        cache_ttl = 300.0 if exp is None else min(exp - time.time(), 300.0)
+        self._token_cache[key] = (ctx, time.monotonic() + cache_ttl)
+        while len(self._token_cache) > self.MAX_CACHE_ENTRIES:
+            self._token_cache.popitem(last=False)
         return ctx
 
 
@@ -135,7 +271,10 @@ async def main() -> None:
             """Fine-grained access control example."""
             return f"Data written for {user_id}"
 
-    await server.serve(port=8000, verbose=False)
+    try:
+        await server.serve(port=8000, verbose=False)
+    finally:
+        await provider.aclose()
 
 
 if __name__ == "__main__":
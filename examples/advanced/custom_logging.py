@@ -28,11 +28,12 @@ Reference:
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import logging
-from typing import Any, ClassVar, cast
+from typing import Any, ClassVar, TypedDict
 
-from pydantic import BaseModel
+from pydantic import TypeAdapter
 
 from openmcp import MCPServer, tool
 from openmcp.utils.logger import ColoredFormatter, OpenMCPHandler, get_logger, setup_logger
@@ -47,7 +48,7 @@ except ImportError:  # pragma: no cover
     orjson = None
 
 
-class LogEvent(BaseModel):
+class LogEvent(TypedDict):
     """Structured log payload."""
 
     stage: str
@@ -55,26 +56,45 @@ class LogEvent(BaseModel):
     severity: str
 
 
-def _serialize(payload: dict[str, Any]) -> str:
-    """Serialize payload using fastest available encoder."""
-    if orjson is not None:
-        encoded = orjson.dumps(payload, option=orjson.OPT_APPEND_NEWLINE)
-        return cast("bytes", encoded).decode()
+# Compiled once: validating into a TypedDict yields a plain dict directly, with
+# no model instance to construct and dump per record.
+_LOG_EVENT_ADAPTER = TypeAdapter(LogEvent)
+
+# Internal events are built by our own code and need no validation, so use a
+# plain dict; LogEvent stays at the payload_transformer boundary.
+_echo_event = functools.partial(dict, stage="echo", severity="info")
+
+
+def _orjson_serialize(payload: dict[str, Any]) -> str:
+    """Serialize payload with orjson (options resolved once at import)."""
+    return _ORJSON_DUMPS(payload, option=_ORJSON_OPTIONS).decode()
+
+
+def _stdlib_serialize(payload: dict[str, Any]) -> str:
+    """Serialize payload with the standard library encoder."""
     return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
 
 
+# Pick the fastest available encoder once instead of branching per record.  The
+# handler appends its own line terminator, so no OPT_APPEND_NEWLINE here.
+if orjson is not None:
+    _ORJSON_DUMPS = orjson.dumps
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+    _serialize = _orjson_serialize
+else:
+    _serialize = _stdlib_serialize
+
+
+def _validate_context(payload: dict[str, Any]) -> dict[str, Any]:
+    """Validate the structured context of a log payload against LogEvent."""
+    context = payload.get("context")
+    return {**payload, "context": _LOG_EVENT_ADAPTER.validate_python(context) if context else None}
+
+
 # Example 1: JSON logging for production
 def configure_json_logging() -> None:
     """Configure structured JSON logging."""
-    setup_logger(
-        use_json=True,
-        json_serializer=_serialize,
-        payload_transformer=lambda p: {
-            **p,
-            "context": LogEvent(**p.get("context", {})).model_dump() if p.get("context") else None,
-        },
-        force=True,
-    )
+    setup_logger(use_json=True, json_serializer=_serialize, payload_transformer=_validate_context, force=True)
 
 
 # Example 2: Custom color scheme
@@ -109,12 +129,11 @@ async def main() -> None:
 
         @tool()
         async def echo(message: str) -> str:
-            event = LogEvent(stage="echo", message=message, severity="info")
             log = get_logger(__name__)
-            log.info("tool-invoked", **event.model_dump())
+            log.info("tool-invoked", extra={"context": _echo_event(message=message)})
             return message
 
-    await server.serve_stdio(validate=False)
+    await server.serve_stdio()
 
 
 def demo_colors() -> None:
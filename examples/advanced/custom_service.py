@@ -30,7 +30,9 @@ Reference:
 from __future__ import annotations
 
 import asyncio
+from collections import defaultdict
 import logging
+import time
 from dataclasses import dataclass
 from typing import Any
 
@@ -55,25 +57,31 @@ class MetricsService:
     """Custom capability service for server metrics collection."""
 
     def __init__(self) -> None:
-        self._tool_calls: dict[str, int] = {}
-        self._total_latency_ms: float = 0.0
+        self._tool_calls: defaultdict[str, int] = defaultdict(int)
+        self._total_latency_ns: int = 0
         self._request_count: int = 0
         self._error_count: int = 0
 
-    def record_tool_call(self, tool_name: str, latency_ms: float, error: bool = False) -> None:
-        """Record a tool invocation."""
-        self._tool_calls[tool_name] = self._tool_calls.get(tool_name, 0) + 1
-        self._total_latency_ms += latency_ms
+    def record_tool_call(self, tool_name: str, latency_ns: int, error: bool = False) -> None:
+        """Record a tool invocation.
+
+        Latency is accumulated as integer nanoseconds so the running total stays
+        exact; conversion to milliseconds happens only in :meth:`snapshot`.
+        """
+        self._tool_calls[tool_name] += 1
+        self._total_latency_ns += latency_ns
         self._request_count += 1
         if error:
             self._error_count += 1
 
     def snapshot(self) -> MetricsSnapshot:
         """Return current metrics snapshot."""
-        avg_latency = self._total_latency_ms / self._request_count if self._request_count > 0 else 0.0
+        avg_latency = self._total_latency_ns / self._request_count / 1_000_000 if self._request_count > 0 else 0.0
         error_rate = self._error_count / self._request_count if self._request_count > 0 else 0.0
+        # Every recorded call bumps _request_count, so it already equals the sum
+        # of the per-tool counters; snapshots stay O(1) however many tools exist.
         return MetricsSnapshot(
-            tools_called=sum(self._tool_calls.values()),
+            tools_called=self._request_count,
             average_latency_ms=avg_latency,
             error_rate=error_rate,
         )
@@ -81,11 +89,21 @@ class MetricsService:
     def reset(self) -> None:
         """Reset all counters (useful for windowed metrics)."""
         self._tool_calls.clear()
-        self._total_latency_ms = 0.0
+        self._total_latency_ns = 0
         self._request_count = 0
         self._error_count = 0
 
 
+def _fib_pair(n: int) -> tuple[int, int]:
+    """Return ``(F(n), F(n + 1))`` by fast doubling in O(log n) steps."""
+    if n == 0:
+        return (0, 1)
+    a, b = _fib_pair(n >> 1)
+    c = a * ((b << 1) - a)
+    d = a * a + b * b
+    return (d, c + d) if n & 1 else (c, d)
+
+
 class ExtendedMCPServer(MCPServer):
     """MCPServer with injected metrics capability."""
 
@@ -94,23 +112,19 @@ class ExtendedMCPServer(MCPServer):
         self.metrics = MetricsService()
 
         # Wrap existing tool service to intercept calls
-        original_call_tool = self.tools.call_tool
-
-        async def wrapped_call_tool(name: str, arguments: dict[str, Any]) -> CallToolResult:
-            """Intercept tool calls for metrics collection."""
-            import time
-
-            start_ms = time.perf_counter() * 1000
-            error = False
-            try:
-                result = await original_call_tool(name, arguments)
-                error = result.isError
-                return result
-            finally:
-                elapsed_ms = (time.perf_counter() * 1000) - start_ms
-                self.metrics.record_tool_call(name, elapsed_ms, error=error)
+        self._original_call_tool = self.tools.call_tool
+        self.tools.call_tool = self._call_tool_metered  # type: ignore
 
-        self.tools.call_tool = wrapped_call_tool  # type: ignore
+    async def _call_tool_metered(self, name: str, arguments: dict[str, Any]) -> CallToolResult:
+        """Intercept tool calls for metrics collection."""
+        start_ns = time.perf_counter_ns()
+        error = False
+        try:
+            result = await self._original_call_tool(name, arguments)
+            error = result.isError
+            return result
+        finally:
+            self.metrics.record_tool_call(name, time.perf_counter_ns() - start_ns, error=error)
 
 
 async def main() -> None:
@@ -126,12 +140,7 @@ async def main() -> None:
         @tool(description="Compute fibonacci number")
         async def fibonacci(n: int) -> int:
             """Fibonacci computation (intentionally synchronous for demo)."""
-            if n <= 1:
-                return n
-            a, b = 0, 1
-            for _ in range(2, n + 1):
-                a, b = b, a + b
-            return b
+            return _fib_pair(n)[0] if n > 0 else n
 
         @tool(description="Get current metrics")
         async def get_metrics() -> dict[str, Any]:
@@ -35,6 +35,7 @@ from pathlib import Path
 from typing import Any
 
 import anyio
+from anyio.streams.buffered import BufferedByteReceiveStream
 
 from openmcp import MCPServer, tool
 from openmcp.server.transports.base import BaseTransport
@@ -43,6 +44,28 @@ from openmcp.server.transports.base import BaseTransport
 for logger_name in ("mcp", "httpx", "uvicorn", "uvicorn.access", "uvicorn.error"):
     logging.getLogger(logger_name).setLevel(logging.CRITICAL)
 
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover
+    orjson = None
+
+MAX_MESSAGE_BYTES = 4 * 1024 * 1024
+
+if orjson is not None:
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+else:
+    _loads = json.loads
+
+    def _dumps(message: dict[str, Any]) -> bytes:
+        return json.dumps(message, separators=(",", ":")).encode()
+
+
+def _encode_frame(message: dict[str, Any]) -> bytes:
+    """Encode a message as a 4-byte big-endian length prefix plus JSON body."""
+    body = _dumps(message)
+    return len(body).to_bytes(4, "big") + body
+
 
 class UnixSocketTransport(BaseTransport):
     """Custom transport using Unix domain sockets for local IPC.
@@ -67,21 +90,33 @@ class UnixSocketTransport(BaseTransport):
         async def handle_connection(stream: anyio.abc.SocketStream) -> None:
             """Handle a single client connection."""
             async with stream:
-                # Wrap the raw socket stream for JSON-RPC
-                reader = anyio.wrap_file(stream)  # type: ignore
-                writer = anyio.wrap_file(stream)  # type: ignore
-
-                # Minimal JSON-RPC framing: newline-delimited JSON
-                async for line in reader:
+                # Minimal JSON-RPC framing: 4-byte big-endian length prefix,
+                # then the JSON body.  Reads are sized up front, so nothing has
+                # to scan the payload for a delimiter.
+                reader = BufferedByteReceiveStream(stream)
+                while True:
                     try:
-                        message = json.loads(line)
-                        # In a real implementation, dispatch to server._handle_request
-                        # For this stub, echo back
-                        response = {"jsonrpc": "2.0", "id": message.get("id"), "result": "stub"}
-                        await writer.write(json.dumps(response) + "\n")
-                    except json.JSONDecodeError:
-                        self._server._logger.warning(f"Invalid JSON received: {line}")
+                        size = int.from_bytes(await reader.receive_exactly(4), "big")
+                        if size > MAX_MESSAGE_BYTES:
+                            self._server._logger.warning(f"Frame of {size} bytes exceeds limit; closing connection")
+                            return
+                        body = await reader.receive_exactly(size)
+                    except (anyio.EndOfStream, anyio.IncompleteRead):
+                        return
+                    # One bad frame must not escape: it would cancel listener.serve's
+                    # task group and drop every connected client.
+                    try:
+                        message = _loads(body)  # decode and non-UTF-8 errors are both ValueError
+                    except ValueError:
+                        self._server._logger.warning(f"Invalid JSON received: {body!r}")
+                        continue
+                    if not isinstance(message, dict):
+                        self._server._logger.warning(f"Ignoring non-object JSON-RPC frame: {body!r}")
                         continue
+                    # In a real implementation, dispatch to server._handle_request
+                    # For this stub, echo back
+                    response = {"jsonrpc": "2.0", "id": message.get("id"), "result": "stub"}
+                    await stream.send(_encode_frame(response))
 
         listener = await anyio.create_unix_listener(socket_path)
         async with listener:
@@ -10,6 +10,11 @@ Pattern:
 3. Call server.notify_tools_list_changed() after mutations
 4. Clients receive tools/list_changed notifications
 
+Toggles are coalesced: a burst of ``set_feature`` calls within
+``NOTIFY_COALESCE_SECONDS`` produces a single list_changed notification, so
+clients re-fetch the tool list once instead of once per flip.  Each call still
+returns only after that shared notification has gone out.
+
 When to use this pattern:
 - A/B testing with gradual feature rollout
 - Kill switches for unstable features
@@ -32,10 +37,18 @@ from openmcp import MCPServer, tool
 for logger_name in ("mcp", "httpx", "uvicorn", "uvicorn.access", "uvicorn.error"):
     logging.getLogger(logger_name).setLevel(logging.CRITICAL)
 
+logger = logging.getLogger(__name__)
+
 
 server = MCPServer("feature-flagged", allow_dynamic_tools=True)
 _flag_enabled = False
 
+NOTIFY_COALESCE_SECONDS = 0.005
+# Broadcast still inside its coalescing window; later toggles join it.
+_pending_flush: asyncio.Task[None] | None = None
+# Strong references so in-flight broadcasts are not garbage-collected.
+_flush_tasks: set[asyncio.Task[None]] = set()
+
 
 def bootstrap() -> MCPServer:
     """Register the baseline tool set."""
@@ -49,7 +62,11 @@ def bootstrap() -> MCPServer:
 
 
 async def set_feature(*, enabled: bool = False) -> None:
-    """Toggle the experimental search tool at runtime."""
+    """Toggle the experimental search tool at runtime.
+
+    Returns once the (possibly shared) tools/list_changed notification has
+    been sent; a failed broadcast is logged rather than raised.
+    """
     global _flag_enabled
     _flag_enabled = enabled
 
@@ -65,15 +82,38 @@ async def set_feature(*, enabled: bool = False) -> None:
             async def search(query: str) -> str:
                 return f"results for {query}"
 
-    await server.notify_tools_list_changed()
+    # Shield so a cancelled caller does not cancel the broadcast others await.
+    await asyncio.shield(_schedule_list_changed())
+
+
+def _schedule_list_changed() -> asyncio.Task[None]:
+    """Emit one tools/list_changed for every burst of toggles."""
+    global _pending_flush
+    if _pending_flush is None:
+        _pending_flush = asyncio.create_task(_flush_list_changed())
+        _flush_tasks.add(_pending_flush)
+        _pending_flush.add_done_callback(_flush_tasks.discard)
+    return _pending_flush
+
+
+async def _flush_list_changed() -> None:
+    global _pending_flush
+    try:
+        await asyncio.sleep(NOTIFY_COALESCE_SECONDS)
+    finally:
+        # Clear before sending so toggles racing the broadcast get their own.
+        _pending_flush = None
+    try:
+        await server.notify_tools_list_changed()
+    except Exception:
+        logger.exception("tools/list_changed broadcast failed")
 
 
 async def main() -> None:
     """Launch the server in STDIO mode for development."""
     bootstrap()
     print("Serving feature-flagged tools. Toggle via: await set_feature(enabled=True|False)")
-    async with asyncio.TaskGroup() as tg:
-        tg.create_task(server.serve_stdio(validate=False))
+    await server.serve_stdio(validate=False)
 
 
 if __name__ == "__main__":
@@ -23,8 +23,9 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import json
+import functools
 import os
+import sys
 from typing import Any
 
 from pydantic import ValidationError
@@ -37,13 +38,22 @@ from openmcp.types import (
     ClientRequest,
     ListToolsRequest,
     ListToolsResult,
+    TextContent,
 )
-from openmcp.utils import to_json
 
 
 DEFAULT_URL = os.getenv("MCP_SERVER_URL", "http://127.0.0.1:8000/mcp")
 
 
+def _print_result(result: CallToolResult) -> None:
+    """Pretty-print for terminals; emit compact JSON when stdout is piped."""
+    # pydantic-core serializes the model straight to JSON in one pass, with no
+    # intermediate dict for a second encoder to walk.
+    indent = 2 if sys.stdout.isatty() else None
+    sys.stdout.write(result.model_dump_json(by_alias=True, indent=indent))
+    sys.stdout.write("\n")
+
+
 async def run_client(args: argparse.Namespace) -> None:
     async with open_connection(url=args.url, transport=args.transport) as client:
         init = client.initialize_result
@@ -54,21 +64,7 @@ async def run_client(args: argparse.Namespace) -> None:
         print(f"Connected to {server.name} v{server.version or '0.0.0'} via {args.transport}")
         print(f"Negotiated MCP protocol version: {init.protocolVersion}\n")
 
-        list_request = ClientRequest(ListToolsRequest())
-        tools_result = await client.send_request(list_request, ListToolsResult)
-
-        print("Available tools:")
-        for idx, tool in enumerate(tools_result.tools, start=1):
-            desc = tool.description or "(no description)"
-            print(f"  {idx:>2}. {tool.name} — {desc}")
-
-        if not tools_result.tools:
-            raise SystemExit("Server returned zero tools; nothing to call.")
-
         tool_name = "supabase_query"
-        if tool_name not in {tool.name for tool in tools_result.tools}:
-            raise SystemExit(f"Tool '{tool_name}' not found in server response.")
-
         call_arguments: dict[str, Any] = {
             "table": args.table,
             "columns": args.columns,
@@ -84,22 +80,40 @@ async def run_client(args: argparse.Namespace) -> None:
             message = "Failed to build CallToolRequest; check provided arguments."
             raise SystemExit(f"{message}\n{exc}") from exc
 
-        call_result = await client.send_request(call_request, CallToolResult)
+        # The call does not depend on the listing (we only check membership
+        # afterwards), so issue both requests concurrently: one round trip of
+        # wall-clock latency instead of two.  MCP 2025-06-18 removed JSON-RPC
+        # batching, so concurrent requests on one session are the equivalent.
+        list_request = ClientRequest(ListToolsRequest())
+        tools_result, call_result = await asyncio.gather(
+            client.send_request(list_request, ListToolsResult),
+            client.send_request(call_request, CallToolResult),
+        )
+
+        print("Available tools:")
+        found = False
+        for idx, tool in enumerate(tools_result.tools, start=1):
+            desc = tool.description or "(no description)"
+            print(f"  {idx:>2}. {tool.name} — {desc}")
+            found = found or tool.name == tool_name
+
+        if not tools_result.tools:
+            raise SystemExit("Server returned zero tools; nothing to call.")
+
+        if not found:
+            raise SystemExit(f"Tool '{tool_name}' not found in server response.")
 
         status = "error" if call_result.isError else "success"
         print(f"\nTool call status: {status}")
         if call_result.isError:
-            text_blocks = [block for block in call_result.content if getattr(block, "type", None) == "text"]
-            if text_blocks:
-                first = text_blocks[0]
-                message = getattr(first, "text", None)
-                if message:
-                    print(f"Server reported: {message}")
+            message = next((block.text for block in call_result.content if isinstance(block, TextContent)), None)
+            if message:
+                print(f"Server reported: {message}")
 
-        payload = to_json(call_result)
-        print(json.dumps(payload, indent=2))
+        _print_result(call_result)
 
 
+@functools.cache
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="MCP client for the Supabase REST demo")
     parser.add_argument("--url", default=DEFAULT_URL, help="MCP endpoint URL (default: %(default)s)")
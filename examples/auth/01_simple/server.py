@@ -12,12 +12,19 @@ Quick start::
     $ export SUPABASE_SECRET_KEY="<service_role_key>"
     $ cd ~/Desktop/dedalus-labs/codebase/openmcp
     $ uv run python examples/auth/01_simple/server.py
+
+Set ``SUPABASE_CACHE_TTL`` (seconds, default ``0`` = off) to serve repeated
+identical queries from a small in-process cache.
 """
 
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict
+import copy
+import json
 import os
+import time
 from typing import Any
 
 import httpx
@@ -27,6 +34,13 @@ load_dotenv()
 
 from openmcp import MCPServer, tool
 
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover
+    orjson = None
+
+_loads = orjson.loads if orjson is not None else json.loads
+
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_SECRET_KEY = os.getenv("SUPABASE_SECRET_KEY")
 
@@ -35,6 +49,28 @@ if not SUPABASE_URL:
 if not SUPABASE_SECRET_KEY:
     raise RuntimeError("SUPABASE_SECRET_KEY must be set")
 
+# Static for the process lifetime: build the REST base URL and headers once and share one pooled
+# client so tool calls reuse keep-alive connections instead of a fresh TLS
+# handshake per query.
+SUPABASE_REST_BASE = f"{SUPABASE_URL.rstrip('/')}/rest/v1/"
+SUPABASE_HEADERS = {
+    "apikey": SUPABASE_SECRET_KEY,
+    "Authorization": f"Bearer {SUPABASE_SECRET_KEY}",
+    "Accept": "application/json",
+    "Prefer": "return=representation",
+}
+HTTP_CLIENT = httpx.AsyncClient(
+    timeout=30.0,
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+)
+
+# Opt-in response cache for agent loops that repeat the same query: successful
+# results keyed on (table, columns, limit), least recently used entry evicted
+# when full.  Entries are private snapshots; callers always get their own copy.
+CACHE_TTL = float(os.getenv("SUPABASE_CACHE_TTL", "0"))
+CACHE_MAX_ENTRIES = 256
+_response_cache: OrderedDict[tuple[str, str, int | None], tuple[float, dict[str, Any]]] = OrderedDict()
+
 server = MCPServer(name="supabase-rest-demo")
 
 
@@ -56,25 +92,26 @@ with server.binding():
         Returns:
             Query results with status and body
         """
+        cache_key = (table, columns, limit)
+        if CACHE_TTL > 0:
+            cached = _response_cache.get(cache_key)
+            if cached is not None:
+                if cached[0] > time.monotonic():
+                    _response_cache.move_to_end(cache_key)
+                    return copy.deepcopy(cached[1])
+                del _response_cache[cache_key]
+
         params = {"select": columns}
         if limit is not None:
             params["limit"] = str(limit)
 
-        headers = {
-            "apikey": SUPABASE_SECRET_KEY,
-            "Authorization": f"Bearer {SUPABASE_SECRET_KEY}",
-            "Accept": "application/json",
-            "Prefer": "return=representation",
-        }
-
-        url = f"{SUPABASE_URL.rstrip('/')}/rest/v1/{table}"
+        url = SUPABASE_REST_BASE + table
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, headers=headers, params=params)
+        response = await HTTP_CLIENT.get(url, headers=SUPABASE_HEADERS, params=params)
 
         content_type = response.headers.get("content-type", "")
         if "application/json" in content_type:
-            body: Any = response.json()
+            body: Any = _loads(response.content)
         else:
             body = response.text
 
@@ -93,21 +130,30 @@ with server.binding():
         else:
             server._logger.info("supabase request succeeded", extra={"context": {**log_context, "row_count": row_count}})
 
-        return {
+        result = {
             "url": url,
             "status": response.status_code,
             "body": body,
         }
+        if CACHE_TTL > 0 and response.status_code < 400:
+            _response_cache[cache_key] = (time.monotonic() + CACHE_TTL, copy.deepcopy(result))
+            _response_cache.move_to_end(cache_key)
+            if len(_response_cache) > CACHE_MAX_ENTRIES:
+                _response_cache.popitem(last=False)
+        return result
 
 
 async def main() -> None:
     print(f"[supabase-demo] starting — SUPABASE_URL={SUPABASE_URL}")
-    await server.serve(
-        transport="streamable-http",
-        verbose=False,
-        log_level="info",
-        uvicorn_options={"access_log": False},
-    )
+    try:
+        await server.serve(
+            transport="streamable-http",
+            verbose=False,
+            log_level="info",
+            uvicorn_options={"access_log": False},
+        )
+    finally:
+        await HTTP_CLIENT.aclose()
 
 
 if __name__ == "__main__":
@@ -39,18 +39,16 @@ from __future__ import annotations
 import argparse
 import asyncio
 import base64
+import functools
 import hashlib
 import json
 import os
 import secrets
-import string
-import threading
-import webbrowser
+import sys
+import time
+from pathlib import Path
 from typing import Any
-from urllib.parse import parse_qs, urlparse
-
-from http.server import BaseHTTPRequestHandler
-import socketserver
+from urllib.parse import parse_qsl, urlparse
 
 import httpx
 from pydantic import ValidationError
@@ -64,7 +62,6 @@ from openmcp.types import (
     ListToolsRequest,
     ListToolsResult,
 )
-from openmcp.utils import to_json
 
 DEFAULT_SERVER_URL = os.getenv("MCP_SERVER_URL", "http://127.0.0.1:8000/mcp")
 DEFAULT_RESOURCE = os.getenv("MCP_RESOURCE_URL", "http://127.0.0.1:8000")
@@ -72,83 +69,130 @@ DEFAULT_ISSUER = os.getenv("AS_ISSUER", "http://localhost:4444")
 DEFAULT_SCOPE = os.getenv("MCP_REQUIRED_SCOPES", "mcp:tools:call")
 DEFAULT_CLIENT_ID = os.getenv("MCP_CLIENT_ID", "dedalus-browser")
 DEFAULT_CALLBACK_PORT = int(os.getenv("MCP_CALLBACK_PORT", "8400"))
+TOKEN_CACHE_DIR = Path.home() / ".cache" / "openmcp"
+TOKEN_EXPIRY_MARGIN = 60  # seconds; refresh slightly before the AS says the token expires
 
 
 class OAuthError(RuntimeError):
     """Raised when the OAuth handshake fails."""
 
 
-class _CallbackServer(socketserver.TCPServer):
-    allow_reuse_address = True
+CALLBACK_PATH = "/callback"
+
+# The callback listener only ever sends these two responses, so encode them once.
+_CALLBACK_BODY = b"<html><body><h1>Authentication complete</h1><p>You can return to the CLI.</p></body></html>"
+_CALLBACK_RESPONSE = (
+    b"HTTP/1.1 200 OK\r\nContent-Type: text/html; charset=utf-8\r\n"
+    b"Content-Length: " + str(len(_CALLBACK_BODY)).encode() + b"\r\nConnection: close\r\n\r\n" + _CALLBACK_BODY
+)
+_NOT_FOUND_RESPONSE = (
+    b"HTTP/1.1 404 Not Found\r\nContent-Type: text/plain\r\n"
+    b"Content-Length: 21\r\nConnection: close\r\n\r\nInvalid callback path"
+)
 
 
 def _generate_pkce() -> tuple[str, str]:
-    alphabet = string.ascii_letters + string.digits + "-._~"
-    verifier = "".join(secrets.choice(alphabet) for _ in range(64))
+    # 48 random bytes -> 64 base64url characters, all within the RFC 7636
+    # unreserved set, from a single urandom call.
+    verifier = secrets.token_urlsafe(48)
     digest = hashlib.sha256(verifier.encode("ascii")).digest()
-    challenge = base64.urlsafe_b64encode(digest).decode().rstrip("=")
+    # A SHA-256 digest is 32 bytes, so its base64 form always ends in exactly one "=".
+    challenge = base64.urlsafe_b64encode(digest)[:-1].decode("ascii")
     return verifier, challenge
 
 
-def _start_callback_listener(state: str, port: int) -> tuple[socketserver.TCPServer, asyncio.Future]:
-    loop = asyncio.get_running_loop()
-    future: asyncio.Future[dict[str, Any]] = loop.create_future()
-    callback_path = "/callback"
+async def _start_callback_listener(port: int) -> tuple[asyncio.Server, asyncio.Future[dict[str, Any]]]:
+    """Listen for the single OAuth redirect on the running event loop."""
+    future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
 
-    class Handler(BaseHTTPRequestHandler):
-        def log_message(self, format: str, *args: Any) -> None:  # noqa: A003
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            writer.close()
             return
 
-        def do_GET(self) -> None:  # noqa: D401
-            parsed = urlparse(self.path)
-            if parsed.path != callback_path:
-                self.send_response(404)
-                self.end_headers()
-                self.wfile.write(b"Invalid callback path")
-                return
-
-            params = parse_qs(parsed.query)
-            result = {
-                "code": params.get("code", [None])[0],
-                "state": params.get("state", [None])[0],
-                "error": params.get("error", [None])[0],
-                "error_description": params.get("error_description", [None])[0],
-            }
-
-            body = (
-                "<html><body><h1>Authentication complete</h1>"
-                "<p>You can return to the CLI.</p></body></html>"
-            )
-            encoded = body.encode("utf-8")
-            self.send_response(200)
-            self.send_header("Content-Type", "text/html; charset=utf-8")
-            self.send_header("Content-Length", str(len(encoded)))
-            self.end_headers()
-            self.wfile.write(encoded)
-
+        # Request line: b"GET /callback?code=...&state=... HTTP/1.1"
+        method, _, rest = head.partition(b" ")
+        target = rest.split(b" ", 1)[0].decode("latin-1") if method == b"GET" else ""
+        parsed = urlparse(target)
+        if parsed.path != CALLBACK_PATH:
+            writer.write(_NOT_FOUND_RESPONSE)
+        else:
+            params = dict(parse_qsl(parsed.query))
+            result = {key: params.get(key) for key in ("code", "state", "error", "error_description")}
+            writer.write(_CALLBACK_RESPONSE)
             if not future.done():
-                loop.call_soon_threadsafe(future.set_result, result)
+                future.set_result(result)
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
 
-    server = _CallbackServer(("127.0.0.1", port), Handler)
-    thread = threading.Thread(target=server.serve_forever, daemon=True)
-    thread.start()
-    server._thread = thread  # type: ignore[attr-defined]
+    server = await asyncio.start_server(handle, "127.0.0.1", port)
     return server, future
 
 
-def _stop_callback_listener(server: socketserver.TCPServer) -> None:
-    thread = getattr(server, "_thread", None)
-    server.shutdown()
-    server.server_close()
-    if isinstance(thread, threading.Thread):
-        thread.join(timeout=1)
+async def _stop_callback_listener(server: asyncio.Server) -> None:
+    server.close()
+    await server.wait_closed()
+
+
+def _token_cache_path(args: argparse.Namespace) -> Path:
+    key = "\0".join((args.issuer, args.client_id, args.scope, args.resource))
+    digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    return TOKEN_CACHE_DIR / f"token-{digest}.json"
+
+
+def _load_cached_token(path: Path) -> dict[str, Any] | None:
+    try:
+        cached = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    # A hand-edited or foreign cache file is a miss, never a crash or a bogus token.
+    if not isinstance(cached, dict):
+        return None
+    expires_at = cached.get("expires_at")
+    access_token = cached.get("access_token")
+    if isinstance(expires_at, bool) or not isinstance(expires_at, (int, float)):
+        return None
+    if not isinstance(access_token, str) or not access_token:
+        return None
+    if time.time() < expires_at - TOKEN_EXPIRY_MARGIN:
+        return {"access_token": access_token}
+    return None
+
+
+def _is_unauthorized(exc: BaseException) -> bool:
+    """Return True when *exc*, or anything it wraps, is an HTTP 401 response."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code == 401
+    if isinstance(exc, BaseExceptionGroup):
+        return any(_is_unauthorized(inner) for inner in exc.exceptions)
+    return exc.__cause__ is not None and _is_unauthorized(exc.__cause__)
+
+
+def _store_cached_token(path: Path, token_data: dict[str, Any]) -> None:
+    entry = {
+        "access_token": token_data.get("access_token"),
+        "expires_at": time.time() + float(token_data.get("expires_in", 3600)),
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as handle:
+        json.dump(entry, handle)
 
 
 async def fetch_access_token(args: argparse.Namespace) -> dict[str, Any]:
+    cache_path = None if args.no_token_cache else _token_cache_path(args)
+    if cache_path is not None and (cached := _load_cached_token(cache_path)) is not None:
+        print("Using cached access token.")
+        return cached
+
     verifier, challenge = _generate_pkce()
     state = secrets.token_urlsafe(16)
 
-    redirect_uri = args.redirect_uri or f"http://127.0.0.1:{args.callback_port}/callback"
+    redirect_uri = args.redirect_uri or f"http://127.0.0.1:{args.callback_port}{CALLBACK_PATH}"
 
     query = {
         "response_type": "code",
@@ -164,25 +208,22 @@ async def fetch_access_token(args: argparse.Namespace) -> dict[str, Any]:
     token_url = f"{args.issuer.rstrip('/')}/oauth2/token"
     auth_url = f"{args.issuer.rstrip('/')}/oauth2/auth"
 
-    server, future = _start_callback_listener(state, args.callback_port)
+    server, future = await _start_callback_listener(args.callback_port)
 
     auth_request = httpx.QueryParams(query)
     full_auth_url = f"{auth_url}?{auth_request}"
     print("Opening browser for Clerk sign-in…")
-    if not webbrowser.open(full_auth_url, new=1, autoraise=True):
-        print("Please open this URL manually:")
-        print(full_auth_url)
-    else:
-        print("If the browser did not open, paste this URL manually:")
-        print(full_auth_url)
+    print(f"If the browser does not open, paste this URL manually:\n{full_auth_url}")
+    import webbrowser  # Deferred: only needed on a token-cache miss.
+
+    webbrowser.open(full_auth_url, new=1, autoraise=True)
 
     try:
         callback = await asyncio.wait_for(future, timeout=300)
     except asyncio.TimeoutError as exc:
-        _stop_callback_listener(server)
         raise OAuthError("Timed out waiting for the authorization response.") from exc
     finally:
-        _stop_callback_listener(server)
+        await _stop_callback_listener(server)
 
     error = callback.get("error")
     if error:
@@ -221,9 +262,13 @@ async def fetch_access_token(args: argparse.Namespace) -> dict[str, Any]:
         raise OAuthError(
             f"Token request failed: HTTP {token_response.status_code} {token_response.text}"
         )
-    return token_response.json()
+    token_data = token_response.json()
+    if cache_path is not None and token_data.get("access_token"):
+        _store_cached_token(cache_path, token_data)
+    return token_data
 
 
+@functools.cache
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Supabase OAuth client demo")
     parser.add_argument("--url", default=DEFAULT_SERVER_URL, help="MCP endpoint (default: %(default)s)")
@@ -259,9 +304,23 @@ def build_parser() -> argparse.ArgumentParser:
         "--access-token",
         help="Skip OAuth flow and use an existing access token",
     )
+    parser.add_argument(
+        "--no-token-cache",
+        action="store_true",
+        help=f"Always run the OAuth flow instead of reusing a token cached under {TOKEN_CACHE_DIR}",
+    )
     return parser
 
 
+def _print_result(result: CallToolResult) -> None:
+    """Pretty-print for terminals; emit compact JSON when stdout is piped."""
+    # pydantic-core serializes the model straight to JSON in one pass, with no
+    # intermediate dict for a second encoder to walk.
+    indent = 2 if sys.stdout.isatty() else None
+    sys.stdout.write(result.model_dump_json(by_alias=True, indent=indent))
+    sys.stdout.write("\n")
+
+
 async def call_supabase_tool(args: argparse.Namespace, access_token: str) -> None:
     headers = {"Authorization": f"Bearer {access_token}"}
     async with open_connection(url=args.url, transport=args.transport, headers=headers) as client:
@@ -273,17 +332,34 @@ async def call_supabase_tool(args: argparse.Namespace, access_token: str) -> Non
         )
         print(f"Negotiated MCP protocol version: {init.protocolVersion}\n")
 
+        expected_tool = "supabase_select_live"
+        arguments: dict[str, Any] = {"table": args.table, "columns": args.columns}
+        if args.limit is not None:
+            arguments["limit"] = args.limit
+
+        try:
+            request = ClientRequest(
+                CallToolRequest(params=CallToolRequestParams(name=expected_tool, arguments=arguments))
+            )
+        except ValidationError as exc:
+            raise SystemExit(f"Invalid tool arguments: {exc}") from exc
+
+        # Listing and calling are independent, so send both concurrently on the
+        # session (JSON-RPC batching was removed in MCP 2025-06-18).
         list_request = ClientRequest(ListToolsRequest())
-        tools_result = await client.send_request(list_request, ListToolsResult)
+        tools_result, result = await asyncio.gather(
+            client.send_request(list_request, ListToolsResult),
+            client.send_request(request, CallToolResult),
+        )
 
         print("Available tools:")
+        found = False
         for idx, tool in enumerate(tools_result.tools, start=1):
             desc = tool.description or "(no description)"
             print(f"  {idx:>2}. {tool.name} — {desc}")
+            found = found or tool.name == expected_tool
 
-        expected_tool = "supabase_select_live"
-        available = {tool.name for tool in tools_result.tools}
-        if expected_tool not in available:
+        if not found:
             print(
                 f"Tool '{expected_tool}' is not available on server '{init.serverInfo.name}'.\n"
                 "Ensure the protected server (examples/auth/02_as/server.py) is running "
@@ -291,23 +367,10 @@ async def call_supabase_tool(args: argparse.Namespace, access_token: str) -> Non
             )
             return
 
-        arguments: dict[str, Any] = {"table": args.table, "columns": args.columns}
-        if args.limit is not None:
-            arguments["limit"] = args.limit
-
-        try:
-            request = ClientRequest(
-                CallToolRequest(params=CallToolRequestParams(name="supabase_select_live", arguments=arguments))
-            )
-        except ValidationError as exc:
-            raise SystemExit(f"Invalid tool arguments: {exc}") from exc
-
-        result = await client.send_request(request, CallToolResult)
         status = "error" if result.isError else "success"
         print(f"\nTool call status: {status}")
 
-        payload = to_json(result)
-        print(json.dumps(payload, indent=2))
+        _print_result(result)
 
 
 async def main() -> None:
@@ -329,7 +392,19 @@ async def main() -> None:
     if not access_token:
         raise SystemExit("Authorization Server response lacked access_token")
 
-    await call_supabase_tool(args, access_token)
+    try:
+        await call_supabase_tool(args, access_token)
+    except Exception as exc:
+        if not _is_unauthorized(exc):
+            raise
+        # The token may have been revoked before its recorded expiry; drop it so
+        # the next run goes back to the Authorization Server.
+        if not (args.access_token or args.no_token_cache):
+            _token_cache_path(args).unlink(missing_ok=True)
+        raise SystemExit(
+            "MCP server rejected the access token (HTTP 401). Any cached token was cleared; "
+            "rerun to request a fresh one, or pass --no-token-cache to skip the cache entirely."
+        ) from exc
 
 
 if __name__ == "__main__":
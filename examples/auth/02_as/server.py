@@ -37,31 +37,48 @@ Client command (separate shell)::
 
 The client spins up a temporary callback listener, opens Clerk’s hosted login
 page, and trades the resulting authorization code for an access token before
-calling ``supabase_select_live``.
+calling ``supabase_select_live``.  ``supabase_select_batch`` runs several such
+queries concurrently in a single tool call.
 """
 
 from __future__ import annotations
 
 import asyncio
+import functools
+import json
+import logging
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
+from urllib.parse import urlsplit
 
 import httpx
 from dotenv import load_dotenv
+from pydantic import BaseModel, Field
 
 from openmcp import MCPServer, get_context, tool
 from openmcp.server.authorization import AuthorizationConfig
 from openmcp.server.authorization import AuthorizationContext
 from openmcp.server.services.jwt_validator import JWTValidator, JWTValidatorConfig
 
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover
+    orjson = None
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Bodies above this size are decoded in a worker thread so one large select
+# does not stall every other request on the event loop.
+OFFLOAD_PARSE_BYTES = 256 * 1024
+
 
 load_dotenv()
 
 
 AS_ISSUER = os.getenv("AS_ISSUER", "http://localhost:4444").rstrip("/")
 MCP_RESOURCE_URL = os.getenv("MCP_RESOURCE_URL", "http://127.0.0.1:8000").rstrip("/")
-REQUIRED_SCOPES = [scope for scope in os.getenv("MCP_REQUIRED_SCOPES", "mcp:tools:call").split() if scope]
+REQUIRED_SCOPES = os.getenv("MCP_REQUIRED_SCOPES", "mcp:tools:call").split()
 JWKS_URI = os.getenv("AS_JWKS_URI", f"{AS_ISSUER}/.well-known/jwks.json")
 
 if not REQUIRED_SCOPES:
@@ -79,6 +96,15 @@ class SupabaseCredentials:
 
     url: str
     service_key: str
+    _headers: dict[str, str] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._headers = {
+            "apikey": self.service_key,
+            "Authorization": f"Bearer {self.service_key}",
+            "Accept": "application/json",
+            "Prefer": "return=representation",
+        }
 
     @classmethod
     def from_env(cls) -> "SupabaseCredentials":
@@ -91,12 +117,7 @@ class SupabaseCredentials:
         return cls(url=url.rstrip("/"), service_key=key)
 
     def auth_headers(self) -> dict[str, str]:
-        return {
-            "apikey": self.service_key,
-            "Authorization": f"Bearer {self.service_key}",
-            "Accept": "application/json",
-            "Prefer": "return=representation",
-        }
+        return self._headers
 
 
 def resolve_supabase_credentials(auth_ctx: AuthorizationContext | None) -> SupabaseCredentials:
@@ -116,23 +137,43 @@ def resolve_supabase_credentials(auth_ctx: AuthorizationContext | None) -> Supab
     """
 
     _ = auth_ctx  # placeholder until per-user handles are wired
+    return _env_credentials()
+
+
+@functools.cache
+def _env_credentials() -> SupabaseCredentials:
+    # The environment is static per process, so read it on first use only.
+    # Failures are not cached, so a missing variable keeps raising per call.
     return SupabaseCredentials.from_env()
 
 
-def _audiences(base: str) -> list[str]:
-    clean = base.rstrip("/")
-    candidates = {clean}
-    if clean.endswith("/mcp"):
-        parent = clean[: -len("/mcp")]
+def _audiences(base: str) -> frozenset[str]:
+    """Accept tokens minted for either the server origin or its ``/mcp`` endpoint."""
+    clean = base.strip()
+    parts = urlsplit(clean)
+    if parts.scheme and parts.netloc:
+        origin, path = f"{parts.scheme}://{parts.netloc}", parts.path.rstrip("/")
+    else:  # No scheme: treat the value as an opaque prefix rather than invent "://".
+        origin, path = "", clean.rstrip("/")
+    candidates = {origin + path}
+    if path.endswith("/mcp"):
+        parent = origin + path[: -len("/mcp")]
         if parent:
             candidates.add(parent)
     else:
-        candidates.add(f"{clean}/mcp")
-    return sorted(candidates)
+        candidates.add(f"{origin}{path}/mcp")
+    return frozenset(candidates)
 
 
 audience_candidates = _audiences(MCP_RESOURCE_URL)
 
+# One pooled client for the process lifetime so tool calls reuse keep-alive
+# connections to Supabase instead of paying a TCP+TLS handshake per query.
+HTTP_CLIENT = httpx.AsyncClient(
+    timeout=30.0,
+    limits=httpx.Limits(max_keepalive_connections=100, max_connections=1000),
+)
+
 server = MCPServer(
     name="supabase-connector-demo",
     instructions=(
@@ -151,41 +192,61 @@ jwt_config = JWTValidatorConfig(
     audience=audience_candidates,
     required_scopes=REQUIRED_SCOPES,
 )
-server.set_authorization_provider(JWTValidator(jwt_config))
+jwt_validator = JWTValidator(jwt_config)
+server.set_authorization_provider(jwt_validator)
 
 
-with server.binding():
+MAX_BATCH_QUERIES = 20
 
-    @tool(description="Execute a Supabase REST query using the configured service role key.")
-    async def supabase_select_live(
-        table: str = "users",
-        columns: str = "*",
-        limit: int | None = 5,
-    ) -> dict[str, Any]:
-        ctx = get_context()
-        auth_ctx = ctx.auth_context
-        subject = getattr(auth_ctx, "subject", None) if auth_ctx else None
-        scopes = getattr(auth_ctx, "scopes", None) if auth_ctx else None
 
-        creds = resolve_supabase_credentials(auth_ctx)
+class Query(BaseModel):
+    """One entry of a ``supabase_select_batch`` call."""
 
-        params = {"select": columns}
-        if limit is not None:
-            params["limit"] = str(limit)
+    # Interpolated into the REST path, so only plain identifiers are allowed.
+    table: str = Field(pattern=r"^[A-Za-z_][A-Za-z0-9_]*$", max_length=63)
+    columns: str = Field("*", min_length=1, max_length=1024)
+    limit: int | None = Field(5, ge=1, le=1000)
 
-        url = f"{creds.url}/rest/v1/{table}"
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, headers=creds.auth_headers(), params=params)
+class SelectBatchInput(BaseModel):
+    """Input schema for ``supabase_select_batch``; each query is validated on its own."""
 
-        body: Any
-        content_type = response.headers.get("content-type", "")
-        if "application/json" in content_type:
-            body = response.json()
-        else:
-            body = response.text
+    queries: list[Query] = Field(min_length=1, max_length=MAX_BATCH_QUERIES)
+
+
+async def _select(
+    creds: SupabaseCredentials,
+    table: str,
+    columns: str,
+    limit: int | None,
+    subject: str | None,
+    scopes: list[str] | None,
+) -> dict[str, Any]:
+    params = {"select": columns}
+    if limit is not None:
+        params["limit"] = str(limit)
 
-        extra = {
+    url = f"{creds.url}/rest/v1/{table}"
+
+    response = await HTTP_CLIENT.get(url, headers=creds.auth_headers(), params=params)
+
+    # PostgREST answers in JSON (errors included); fall back to text only
+    # if a proxy in between returned something else.
+    body: Any
+    content = response.content
+    try:
+        if len(content) > OFFLOAD_PARSE_BYTES:
+            body = await asyncio.to_thread(_loads, content)
+        else:
+            body = _loads(content)
+    except ValueError:
+        body = response.text
+
+    failed = response.status_code >= 400
+    level = logging.WARNING if failed else logging.INFO
+    # Only assemble the log context when the record will actually be emitted.
+    if server._logger.isEnabledFor(level):
+        extra: dict[str, Any] = {
             "event": "supabase.request",
             "table": table,
             "limit": limit,
@@ -194,34 +255,97 @@ with server.binding():
         }
         if scopes:
             extra["scopes"] = scopes
-
-        if response.status_code >= 400:
-            server._logger.warning("supabase request failed", extra={"context": extra | {"body": body}})
+        if failed:
+            extra["body"] = body
+            server._logger.warning("supabase request failed", extra={"context": extra})
         else:
-            row_count = len(body) if isinstance(body, list) else None
-            server._logger.info("supabase request succeeded", extra={"context": extra | {"row_count": row_count}})
+            extra["row_count"] = len(body) if isinstance(body, list) else None
+            server._logger.info("supabase request succeeded", extra={"context": extra})
 
-        result = {
-            "url": url,
-            "status": response.status_code,
-            "body": body,
-        }
+    return {
+        "url": url,
+        "status": response.status_code,
+        "body": body,
+    }
+
+
+with server.binding():
+
+    @tool(description="Execute a Supabase REST query using the configured service role key.")
+    async def supabase_select_live(
+        table: str = "users",
+        columns: str = "*",
+        limit: int | None = 5,
+    ) -> dict[str, Any]:
+        ctx = get_context()
+        auth_ctx = ctx.auth_context
+        subject = getattr(auth_ctx, "subject", None) if auth_ctx else None
+        scopes = getattr(auth_ctx, "scopes", None) if auth_ctx else None
+
+        creds = resolve_supabase_credentials(auth_ctx)
+        result = await _select(creds, table, columns, limit, subject, scopes)
         if subject or scopes:
             result["_meta"] = {"subject": subject, "scopes": scopes}
         return result
 
+    @tool(
+        description=(
+            "Run several Supabase REST queries concurrently in one tool call. Each query is an object "
+            'with "table" and optional "columns" (default "*") and "limit" (default 5). '
+            f"Accepts up to {MAX_BATCH_QUERIES} queries; results are returned in order, and a query "
+            'that fails to reach Supabase reports an "error" in its slot.'
+        ),
+        input_schema=SelectBatchInput,
+    )
+    async def supabase_select_batch(queries: list[Query]) -> dict[str, Any]:
+        # Arguments arrive as plain JSON; validate every entry before any request goes out.
+        batch_input = SelectBatchInput.model_validate({"queries": queries})
+
+        ctx = get_context()
+        auth_ctx = ctx.auth_context
+        subject = getattr(auth_ctx, "subject", None) if auth_ctx else None
+        scopes = getattr(auth_ctx, "scopes", None) if auth_ctx else None
+
+        # One auth check and one MCP round trip for N tables; the GETs share
+        # the pooled client's keep-alive connections.
+        creds = resolve_supabase_credentials(auth_ctx)
+        outcomes = await asyncio.gather(
+            *(
+                _select(creds, query.table, query.columns, query.limit, subject, scopes)
+                for query in batch_input.queries
+            ),
+            return_exceptions=True,
+        )
+        # A transport failure on one table should not discard the others;
+        # anything else is a bug and still propagates.
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException) and not isinstance(outcome, httpx.HTTPError):
+                raise outcome
+        results = [
+            {"table": query.table, "error": str(outcome)} if isinstance(outcome, httpx.HTTPError) else outcome
+            for query, outcome in zip(batch_input.queries, outcomes, strict=True)
+        ]
+        batch: dict[str, Any] = {"results": results}
+        if subject or scopes:
+            batch["_meta"] = {"subject": subject, "scopes": scopes}
+        return batch
+
 
 async def main() -> None:
     print(
         "[supabase-oauth-demo] starting — "
         f"issuer={AS_ISSUER}, resource={MCP_RESOURCE_URL}, scopes={','.join(REQUIRED_SCOPES)}"
     )
-    await server.serve(
-        transport="streamable-http",
-        verbose=False,
-        log_level="info",
-        uvicorn_options={"access_log": False},
-    )
+    try:
+        await server.serve(
+            transport="streamable-http",
+            verbose=False,
+            log_level="info",
+            uvicorn_options={"access_log": False},
+        )
+    finally:
+        await HTTP_CLIENT.aclose()
+        await jwt_validator.aclose()
 
 
 if __name__ == "__main__":
@@ -36,8 +36,12 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import hashlib
 import json
 import os
+import sys
+import time
+from pathlib import Path
 from typing import Any
 
 import httpx
@@ -51,8 +55,8 @@ from openmcp.types import (
     ClientRequest,
     ListToolsRequest,
     ListToolsResult,
+    TextContent,
 )
-from openmcp.utils import to_json
 
 DEFAULT_SERVER_URL = os.getenv("MCP_SERVER_URL", "http://127.0.0.1:8000/mcp")
 DEFAULT_RESOURCE = os.getenv("MCP_RESOURCE_URL", "http://127.0.0.1:8000")
@@ -60,14 +64,69 @@ DEFAULT_ISSUER = os.getenv("AS_ISSUER", "http://localhost:4444")
 DEFAULT_SCOPE = os.getenv("MCP_REQUIRED_SCOPES", "mcp:tools:call")
 DEFAULT_CLIENT_ID = os.getenv("MCP_CLIENT_ID", "dedalus-m2m")
 DEFAULT_CLIENT_SECRET = os.getenv("MCP_CLIENT_SECRET")
+TOKEN_CACHE_DIR = Path.home() / ".cache" / "openmcp"
+TOKEN_EXPIRY_MARGIN = 30  # seconds; refresh slightly before the AS says the token expires
 
 
 class OAuthError(RuntimeError):
     """Raised when the OAuth handshake fails."""
 
 
+def _token_cache_path(args: argparse.Namespace) -> Path:
+    key = "\0".join(("client_credentials", args.issuer, args.client_id, args.scope, args.resource))
+    digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    return TOKEN_CACHE_DIR / f"token-{digest}.json"
+
+
+def _load_cached_token(path: Path) -> dict[str, Any] | None:
+    try:
+        cached = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    # A hand-edited or foreign cache file is a miss, never a crash or a bogus token.
+    if not isinstance(cached, dict):
+        return None
+    expires_at = cached.get("expires_at")
+    access_token = cached.get("access_token")
+    if isinstance(expires_at, bool) or not isinstance(expires_at, (int, float)):
+        return None
+    if not isinstance(access_token, str) or not access_token:
+        return None
+    if time.time() < expires_at - TOKEN_EXPIRY_MARGIN:
+        return {"access_token": access_token}
+    return None
+
+
+def _is_unauthorized(exc: BaseException) -> bool:
+    """Return True when *exc*, or anything it wraps, is an HTTP 401 response."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code == 401
+    if isinstance(exc, BaseExceptionGroup):
+        return any(_is_unauthorized(inner) for inner in exc.exceptions)
+    return exc.__cause__ is not None and _is_unauthorized(exc.__cause__)
+
+
+def _store_cached_token(path: Path, token_data: dict[str, Any]) -> None:
+    entry = {
+        "access_token": token_data.get("access_token"),
+        "expires_at": time.time() + float(token_data.get("expires_in", 3600)),
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as handle:
+        json.dump(entry, handle)
+
+
 async def fetch_access_token(args: argparse.Namespace) -> dict[str, Any]:
-    """Exchange client credentials for an access token."""
+    """Exchange client credentials for an access token.
+
+    Tokens are reused from an on-disk cache until shortly before they expire,
+    so repeated CI invocations skip the token round trip.
+    """
+    cache_path = None if args.no_token_cache else _token_cache_path(args)
+    if cache_path is not None and (cached := _load_cached_token(cache_path)) is not None:
+        print("Using cached access token.")
+        return cached
 
     token_url = f"{args.issuer.rstrip('/')}/oauth2/token"
     data = {
@@ -90,7 +149,10 @@ async def fetch_access_token(args: argparse.Namespace) -> dict[str, Any]:
         raise OAuthError(
             f"Token request failed: HTTP {token_response.status_code} {token_response.text}"
         )
-    return token_response.json()
+    token_data = token_response.json()
+    if cache_path is not None and token_data.get("access_token"):
+        _store_cached_token(cache_path, token_data)
+    return token_data
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -115,9 +177,34 @@ def build_parser() -> argparse.ArgumentParser:
         help="MCP transport (default: %(default)s)",
     )
     parser.add_argument("--access-token", help="Skip OAuth flow and use an existing access token")
+    parser.add_argument(
+        "--skip-list",
+        action="store_true",
+        help="Call the tool directly without a tools/list round trip first",
+    )
+    parser.add_argument(
+        "--no-token-cache",
+        action="store_true",
+        help=f"Always request a new token instead of reusing one cached under {TOKEN_CACHE_DIR}",
+    )
     return parser
 
 
+def _print_result(result: CallToolResult) -> None:
+    """Pretty-print for terminals; emit compact JSON when stdout is piped."""
+    # pydantic-core serializes the model straight to JSON in one pass, with no
+    # intermediate dict for a second encoder to walk.
+    indent = 2 if sys.stdout.isatty() else None
+    sys.stdout.write(result.model_dump_json(by_alias=True, indent=indent))
+    sys.stdout.write("\n")
+
+
+def _reports_unknown_tool(result: CallToolResult, name: str) -> bool:
+    """Whether the server rejected the call because ``name`` is not registered."""
+    marker = f'Tool "{name}" is not available'
+    return any(isinstance(block, TextContent) and block.text == marker for block in result.content)
+
+
 async def call_supabase_tool(args: argparse.Namespace, access_token: str) -> None:
     headers = {"Authorization": f"Bearer {access_token}"}
     async with open_connection(url=args.url, transport=args.transport, headers=headers) as client:
@@ -129,23 +216,27 @@ async def call_supabase_tool(args: argparse.Namespace, access_token: str) -> Non
         )
         print(f"Negotiated MCP protocol version: {init.protocolVersion}\n")
 
-        list_request = ClientRequest(ListToolsRequest())
-        tools_result = await client.send_request(list_request, ListToolsResult)
+        expected_tool = "supabase_select_live"
+        unavailable = (
+            f"Tool '{expected_tool}' is not available on server '{init.serverInfo.name}'.\n"
+            "Ensure the protected server (examples/auth/02_as/server.py) is running "
+            "or register an equivalent tool before retrying."
+        )
 
-        print("Available tools:")
-        for idx, tool in enumerate(tools_result.tools, start=1):
-            desc = tool.description or "(no description)"
-            print(f"  {idx:>2}. {tool.name} — {desc}")
+        if not args.skip_list:
+            list_request = ClientRequest(ListToolsRequest())
+            tools_result = await client.send_request(list_request, ListToolsResult)
 
-        expected_tool = "supabase_select_live"
-        available = {tool.name for tool in tools_result.tools}
-        if expected_tool not in available:
-            print(
-                f"Tool '{expected_tool}' is not available on server '{init.serverInfo.name}'.\n"
-                "Ensure the protected server (examples/auth/02_as/server.py) is running "
-                "or register an equivalent tool before retrying."
-            )
-            return
+            print("Available tools:")
+            found = False
+            for idx, tool in enumerate(tools_result.tools, start=1):
+                desc = tool.description or "(no description)"
+                print(f"  {idx:>2}. {tool.name} — {desc}")
+                found = found or tool.name == expected_tool
+
+            if not found:
+                print(unavailable)
+                return
 
         arguments: dict[str, Any] = {"table": args.table, "columns": args.columns}
         if args.limit is not None:
@@ -159,11 +250,14 @@ async def call_supabase_tool(args: argparse.Namespace, access_token: str) -> Non
             raise SystemExit(f"Invalid tool arguments: {exc}") from exc
 
         result = await client.send_request(request, CallToolResult)
+        if result.isError and args.skip_list and _reports_unknown_tool(result, expected_tool):
+            print(unavailable)
+            return
+
         status = "error" if result.isError else "success"
         print(f"\nTool call status: {status}")
 
-        payload = to_json(result)
-        print(json.dumps(payload, indent=2))
+        _print_result(result)
 
 
 async def main() -> None:
@@ -188,7 +282,19 @@ async def main() -> None:
     if not access_token:
         raise SystemExit("Authorization Server response lacked access_token")
 
-    await call_supabase_tool(args, access_token)
+    try:
+        await call_supabase_tool(args, access_token)
+    except Exception as exc:
+        if not _is_unauthorized(exc):
+            raise
+        # The token may have been revoked before its recorded expiry; drop it so
+        # the next run goes back to the Authorization Server.
+        if not (args.access_token or args.no_token_cache):
+            _token_cache_path(args).unlink(missing_ok=True)
+        raise SystemExit(
+            "MCP server rejected the access token (HTTP 401). Any cached token was cleared; "
+            "rerun to request a fresh one, or pass --no-token-cache to skip the cache entirely."
+        ) from exc
 
 
 if __name__ == "__main__":
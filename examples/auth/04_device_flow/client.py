@@ -36,11 +36,10 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import json
 import os
-import secrets
+import sys
+import time
 from typing import Any
-from urllib.parse import urlparse
 
 import httpx
 from pydantic import ValidationError
@@ -53,8 +52,8 @@ from openmcp.types import (
     ClientRequest,
     ListToolsRequest,
     ListToolsResult,
+    TextContent,
 )
-from openmcp.utils import to_json
 
 DEFAULT_SERVER_URL = os.getenv("MCP_SERVER_URL", "http://127.0.0.1:8000/mcp")
 DEFAULT_RESOURCE = os.getenv("MCP_RESOURCE_URL", "http://127.0.0.1:8000")
@@ -70,8 +69,9 @@ class OAuthError(RuntimeError):
 async def fetch_access_token(args: argparse.Namespace) -> dict[str, Any]:
     """Run the RFC 8628 device authorization flow against the AS."""
 
-    token_url = f"{args.issuer.rstrip('/')}/oauth2/token"
-    device_url = f"{args.issuer.rstrip('/')}/oauth2/device/auth"
+    issuer = args.issuer.rstrip("/")
+    token_url = f"{issuer}/oauth2/token"
+    device_url = f"{issuer}/oauth2/device/auth"
 
     async with httpx.AsyncClient(timeout=30.0) as client:
         payload = {
@@ -97,6 +97,8 @@ async def fetch_access_token(args: argparse.Namespace) -> dict[str, Any]:
         verification_uri = device_json["verification_uri"]
         verification_uri_complete = device_json.get("verification_uri_complete")
         interval = int(device_json.get("interval", 5))
+        # Stop polling once the device code lapses instead of looping forever.
+        deadline = time.monotonic() + float(device_json.get("expires_in", 600))
 
         print("\n=== Device authorization required ===")
         print(f" User code: {user_code}")
@@ -106,13 +108,15 @@ async def fetch_access_token(args: argparse.Namespace) -> dict[str, Any]:
             print(f" Visit: {verification_uri} and enter the user code above.")
         print(" Waiting for approval…\n")
 
+        data = {
+            "grant_type": "urn:ietf:params:oauth:grant-type:device_code",
+            "device_code": device_code,
+            "client_id": args.client_id,
+        }
         while True:
+            if time.monotonic() + interval > deadline:
+                raise OAuthError("Device code expired before the request was approved.")
             await asyncio.sleep(interval)
-            data = {
-                "grant_type": "urn:ietf:params:oauth:grant-type:device_code",
-                "device_code": device_code,
-                "client_id": args.client_id,
-            }
             try:
                 token_response = await client.post(token_url, data=data)
             except httpx.ConnectError as exc:
@@ -161,9 +165,29 @@ def build_parser() -> argparse.ArgumentParser:
         "--access-token",
         help="Skip OAuth flow and use an existing access token",
     )
+    parser.add_argument(
+        "--skip-list",
+        action="store_true",
+        help="Call the tool directly without a tools/list round trip first",
+    )
     return parser
 
 
+def _print_result(result: CallToolResult) -> None:
+    """Pretty-print for terminals; emit compact JSON when stdout is piped."""
+    # pydantic-core serializes the model straight to JSON in one pass, with no
+    # intermediate dict for a second encoder to walk.
+    indent = 2 if sys.stdout.isatty() else None
+    sys.stdout.write(result.model_dump_json(by_alias=True, indent=indent))
+    sys.stdout.write("\n")
+
+
+def _reports_unknown_tool(result: CallToolResult, name: str) -> bool:
+    """Whether the server rejected the call because ``name`` is not registered."""
+    marker = f'Tool "{name}" is not available'
+    return any(isinstance(block, TextContent) and block.text == marker for block in result.content)
+
+
 async def call_supabase_tool(args: argparse.Namespace, access_token: str) -> None:
     headers = {"Authorization": f"Bearer {access_token}"}
     async with open_connection(url=args.url, transport=args.transport, headers=headers) as client:
@@ -175,23 +199,27 @@ async def call_supabase_tool(args: argparse.Namespace, access_token: str) -> Non
         )
         print(f"Negotiated MCP protocol version: {init.protocolVersion}\n")
 
-        list_request = ClientRequest(ListToolsRequest())
-        tools_result = await client.send_request(list_request, ListToolsResult)
+        expected_tool = "supabase_select_live"
+        unavailable = (
+            f"Tool '{expected_tool}' is not available on server '{init.serverInfo.name}'.\n"
+            "Ensure the protected server (examples/auth/02_as/server.py) is running "
+            "or register an equivalent tool before retrying."
+        )
 
-        print("Available tools:")
-        for idx, tool in enumerate(tools_result.tools, start=1):
-            desc = tool.description or "(no description)"
-            print(f"  {idx:>2}. {tool.name} — {desc}")
+        if not args.skip_list:
+            list_request = ClientRequest(ListToolsRequest())
+            tools_result = await client.send_request(list_request, ListToolsResult)
 
-        expected_tool = "supabase_select_live"
-        available = {tool.name for tool in tools_result.tools}
-        if expected_tool not in available:
-            print(
-                f"Tool '{expected_tool}' is not available on server '{init.serverInfo.name}'.\n"
-                "Ensure the protected server (examples/auth/02_as/server.py) is running "
-                "or register an equivalent tool before retrying."
-            )
-            return
+            print("Available tools:")
+            found = False
+            for idx, tool in enumerate(tools_result.tools, start=1):
+                desc = tool.description or "(no description)"
+                print(f"  {idx:>2}. {tool.name} — {desc}")
+                found = found or tool.name == expected_tool
+
+            if not found:
+                print(unavailable)
+                return
 
         arguments: dict[str, Any] = {"table": args.table, "columns": args.columns}
         if args.limit is not None:
@@ -205,11 +233,14 @@ async def call_supabase_tool(args: argparse.Namespace, access_token: str) -> Non
             raise SystemExit(f"Invalid tool arguments: {exc}") from exc
 
         result = await client.send_request(request, CallToolResult)
+        if result.isError and args.skip_list and _reports_unknown_tool(result, expected_tool):
+            print(unavailable)
+            return
+
         status = "error" if result.isError else "success"
         print(f"\nTool call status: {status}")
 
-        payload = to_json(result)
-        print(json.dumps(payload, indent=2))
+        _print_result(result)
 
 
 async def main() -> None:
@@ -41,12 +41,11 @@ import argparse
 import asyncio
 import base64
 import hashlib
-import json
 import os
 import secrets
-import string
+import sys
 from typing import Any
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import parse_qsl, urlparse
 
 import httpx
 from pydantic import ValidationError
@@ -60,7 +59,6 @@ from openmcp.types import (
     ListToolsRequest,
     ListToolsResult,
 )
-from openmcp.utils import to_json
 
 DEFAULT_SERVER_URL = os.getenv("MCP_SERVER_URL", "http://127.0.0.1:8000/mcp")
 DEFAULT_RESOURCE = os.getenv("MCP_RESOURCE_URL", "http://127.0.0.1:8000")
@@ -73,10 +71,12 @@ class OAuthError(RuntimeError):
 
 
 def _generate_pkce() -> tuple[str, str]:
-    alphabet = string.ascii_letters + string.digits + "-._~"
-    verifier = "".join(secrets.choice(alphabet) for _ in range(64))
+    # 48 random bytes -> 64 base64url characters, all within the RFC 7636
+    # unreserved set, from a single urandom call.
+    verifier = secrets.token_urlsafe(48)
     digest = hashlib.sha256(verifier.encode("ascii")).digest()
-    challenge = base64.urlsafe_b64encode(digest).decode().rstrip("=")
+    # A SHA-256 digest is 32 bytes, so its base64 form always ends in exactly one "=".
+    challenge = base64.urlsafe_b64encode(digest)[:-1].decode("ascii")
     return verifier, challenge
 
 
@@ -118,12 +118,12 @@ async def fetch_access_token(args: argparse.Namespace) -> dict[str, Any]:
             raise OAuthError("Authorization server did not provide a redirect location")
 
         parsed = urlparse(location)
-        params = parse_qs(parsed.query)
-        code = params.get("code", [None])[0]
-        returned_state = params.get("state", [None])[0]
+        params = dict(parse_qsl(parsed.query))
+        code = params.get("code")
+        returned_state = params.get("state")
         if not code:
-            error = params.get("error", ["unknown_error"])[0]
-            desc = params.get("error_description", ["no description"])[0]
+            error = params.get("error", "unknown_error")
+            desc = params.get("error_description", "no description")
             hint = ""
             if error == "invalid_client":
                 hint = (
@@ -185,6 +185,15 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def _print_result(result: CallToolResult) -> None:
+    """Pretty-print for terminals; emit compact JSON when stdout is piped."""
+    # pydantic-core serializes the model straight to JSON in one pass, with no
+    # intermediate dict for a second encoder to walk.
+    indent = 2 if sys.stdout.isatty() else None
+    sys.stdout.write(result.model_dump_json(by_alias=True, indent=indent))
+    sys.stdout.write("\n")
+
+
 async def call_supabase_tool(args: argparse.Namespace, access_token: str) -> None:
     headers = {"Authorization": f"Bearer {access_token}"}
     async with open_connection(url=args.url, transport=args.transport, headers=headers) as client:
@@ -196,17 +205,34 @@ async def call_supabase_tool(args: argparse.Namespace, access_token: str) -> Non
         )
         print(f"Negotiated MCP protocol version: {init.protocolVersion}\n")
 
+        expected_tool = "supabase_select_live"
+        arguments: dict[str, Any] = {"table": args.table, "columns": args.columns}
+        if args.limit is not None:
+            arguments["limit"] = args.limit
+
+        try:
+            request = ClientRequest(
+                CallToolRequest(params=CallToolRequestParams(name=expected_tool, arguments=arguments))
+            )
+        except ValidationError as exc:
+            raise SystemExit(f"Invalid tool arguments: {exc}") from exc
+
+        # Listing and calling are independent, so send both concurrently on the
+        # session (JSON-RPC batching was removed in MCP 2025-06-18).
         list_request = ClientRequest(ListToolsRequest())
-        tools_result = await client.send_request(list_request, ListToolsResult)
+        tools_result, result = await asyncio.gather(
+            client.send_request(list_request, ListToolsResult),
+            client.send_request(request, CallToolResult),
+        )
 
         print("Available tools:")
+        found = False
         for idx, tool in enumerate(tools_result.tools, start=1):
             desc = tool.description or "(no description)"
             print(f"  {idx:>2}. {tool.name} — {desc}")
+            found = found or tool.name == expected_tool
 
-        expected_tool = "supabase_select_live"
-        available = {tool.name for tool in tools_result.tools}
-        if expected_tool not in available:
+        if not found:
             print(
                 f"Tool '{expected_tool}' is not available on server '{init.serverInfo.name}'.\n"
                 "Ensure the protected server (examples/auth/02_as/server.py) is running "
@@ -214,23 +240,10 @@ async def call_supabase_tool(args: argparse.Namespace, access_token: str) -> Non
             )
             return
 
-        arguments: dict[str, Any] = {"table": args.table, "columns": args.columns}
-        if args.limit is not None:
-            arguments["limit"] = args.limit
-
-        try:
-            request = ClientRequest(
-                CallToolRequest(params=CallToolRequestParams(name="supabase_select_live", arguments=arguments))
-            )
-        except ValidationError as exc:
-            raise SystemExit(f"Invalid tool arguments: {exc}") from exc
-
-        result = await client.send_request(request, CallToolResult)
         status = "error" if result.isError else "success"
         print(f"\nTool call status: {status}")
 
-        payload = to_json(result)
-        print(json.dumps(payload, indent=2))
+        _print_result(result)
 
 
 async def main() -> None:
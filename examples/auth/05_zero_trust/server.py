@@ -44,8 +44,10 @@ invokes the tool with the resulting bearer token.
 from __future__ import annotations
 
 import asyncio
+import json
 import os
 from typing import Any
+from urllib.parse import urlsplit
 
 import httpx
 from dotenv import load_dotenv
@@ -54,6 +56,13 @@ from openmcp import MCPServer, get_context, tool
 from openmcp.server.authorization import AuthorizationConfig
 from openmcp.server.services.jwt_validator import JWTValidator, JWTValidatorConfig
 
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover
+    orjson = None
+
+_loads = orjson.loads if orjson is not None else json.loads
+
 
 load_dotenv()
 
@@ -61,7 +70,7 @@ SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_SECRET_KEY = os.getenv("SUPABASE_SECRET_KEY")
 AS_ISSUER = os.getenv("AS_ISSUER", "http://localhost:4444").rstrip("/")
 MCP_RESOURCE_URL = os.getenv("MCP_RESOURCE_URL", "http://127.0.0.1:8000").rstrip("/")
-REQUIRED_SCOPES = [scope for scope in os.getenv("MCP_REQUIRED_SCOPES", "mcp:tools:call").split() if scope]
+REQUIRED_SCOPES = os.getenv("MCP_REQUIRED_SCOPES", "mcp:tools:call").split()
 JWKS_URI = os.getenv("AS_JWKS_URI", f"{AS_ISSUER}/.well-known/jwks.json")
 
 if not SUPABASE_URL:
@@ -72,20 +81,42 @@ if not REQUIRED_SCOPES:
     raise RuntimeError("Provide at least one scope via MCP_REQUIRED_SCOPES")
 
 
-def _audiences(base: str) -> list[str]:
-    clean = base.rstrip("/")
-    candidates = {clean}
-    if clean.endswith("/mcp"):
-        parent = clean[: -len("/mcp")]
+def _audiences(base: str) -> frozenset[str]:
+    """Accept tokens minted for either the server origin or its ``/mcp`` endpoint."""
+    clean = base.strip()
+    parts = urlsplit(clean)
+    if parts.scheme and parts.netloc:
+        origin, path = f"{parts.scheme}://{parts.netloc}", parts.path.rstrip("/")
+    else:  # No scheme: treat the value as an opaque prefix rather than invent "://".
+        origin, path = "", clean.rstrip("/")
+    candidates = {origin + path}
+    if path.endswith("/mcp"):
+        parent = origin + path[: -len("/mcp")]
         if parent:
             candidates.add(parent)
     else:
-        candidates.add(f"{clean}/mcp")
-    return sorted(candidates)
+        candidates.add(f"{origin}{path}/mcp")
+    return frozenset(candidates)
 
 
 audience_candidates = _audiences(MCP_RESOURCE_URL)
 
+_SUPABASE_BASE = SUPABASE_URL.rstrip("/")
+
+# One pooled client for the process lifetime so tool calls reuse keep-alive
+# connections to Supabase instead of paying a TCP+TLS handshake per query.
+# The service-key headers never change, so they ride along as client defaults.
+HTTP_CLIENT = httpx.AsyncClient(
+    timeout=30.0,
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+    headers={
+        "apikey": SUPABASE_SECRET_KEY,
+        "Authorization": f"Bearer {SUPABASE_SECRET_KEY}",
+        "Accept": "application/json",
+        "Prefer": "return=representation",
+    },
+)
+
 server = MCPServer(
     name="supabase-connector-demo",
     instructions="OAuth 2.1 protected Supabase connector (service-key stays server-side)",
@@ -122,22 +153,14 @@ with server.binding():
         if limit is not None:
             params["limit"] = str(limit)
 
-        headers = {
-            "apikey": SUPABASE_SECRET_KEY,
-            "Authorization": f"Bearer {SUPABASE_SECRET_KEY}",
-            "Accept": "application/json",
-            "Prefer": "return=representation",
-        }
-
-        url = f"{SUPABASE_URL.rstrip('/')}/rest/v1/{table}"
+        url = f"{_SUPABASE_BASE}/rest/v1/{table}"
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, headers=headers, params=params)
+        response = await HTTP_CLIENT.get(url, params=params)
 
         body: Any
         content_type = response.headers.get("content-type", "")
         if "application/json" in content_type:
-            body = response.json()
+            body = _loads(response.content)
         else:
             body = response.text
 
@@ -172,12 +195,15 @@ async def main() -> None:
         "[supabase-oauth-demo] starting — "
         f"issuer={AS_ISSUER}, resource={MCP_RESOURCE_URL}, scopes={','.join(REQUIRED_SCOPES)}"
     )
-    await server.serve(
-        transport="streamable-http",
-        verbose=False,
-        log_level="info",
-        uvicorn_options={"access_log": False},
-    )
+    try:
+        await server.serve(
+            transport="streamable-http",
+            verbose=False,
+            log_level="info",
+            uvicorn_options={"access_log": False},
+        )
+    finally:
+        await HTTP_CLIENT.aclose()
 
 
 if __name__ == "__main__":
@@ -15,11 +15,13 @@ Pattern:
 2. Client sends cancellation notification after timeout
 3. Server receives cancellation and stops execution
 4. Client task group is cancelled to prevent hanging
+5. Session stays open, so follow-up requests reuse the same connection
 
 Key APIs:
 - `client.send_request()` - Initiates async tool call
 - `client.cancel_request(request_id, reason)` - Sends cancellation notification
 - `tg.cancel_scope.cancel()` - Aborts client-side waiting
+- `client.ping()` - Follow-up request on the still-open session
 
 See spec details at:
 https://spec.modelcontextprotocol.io/specification/2025-11-05/basic/cancellation
@@ -45,7 +47,7 @@ from openmcp.types import CallToolRequest, CallToolResult, ClientRequest
 
 
 async def main() -> None:
-    """Invoke a long-running tool, then cancel it after 2 seconds."""
+    """Invoke a long-running tool, cancel it after 2 seconds, then keep using the session."""
     async with streamablehttp_client("http://127.0.0.1:8000/mcp") as (reader, writer, _):
         async with MCPClient(reader, writer) as client:
             request = ClientRequest(CallToolRequest(name="sleep", arguments={"seconds": 10}))
@@ -60,6 +62,11 @@ async def main() -> None:
                 tg.cancel_scope.cancel()
                 print("Cancellation sent")
 
+            # Cancelling one request leaves the transport and session intact, so
+            # later requests reuse the open connection instead of reconnecting.
+            await client.ping()
+            print("Session still usable after cancellation")
+
 
 if __name__ == "__main__":
     anyio.run(main)
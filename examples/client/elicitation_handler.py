@@ -48,6 +48,53 @@ from openmcp.types import (
 SERVER_URL = "http://127.0.0.1:8000/mcp"
 
 
+def _coerce(field_type: str, user_input: str) -> object:
+    """Convert raw CLI input to the JSON type named in the schema."""
+    if field_type == "boolean":
+        return user_input.lower() in ("true", "yes", "1", "y")
+    if field_type == "integer":
+        return int(user_input)
+    if field_type == "number":
+        return float(user_input)
+    return user_input
+
+
+def _prompt_all(properties: dict[str, dict], required: list[str]) -> tuple[dict[str, object], str]:
+    """Collect every field plus the confirmation on the calling (worker) thread.
+
+    Runs as one blocking unit so the event loop hands off to a worker thread
+    once per elicitation rather than once per field.
+    """
+    content: dict[str, object] = {}
+    for field_name, field_schema in properties.items():
+        field_type = field_schema.get("type", "string")
+        is_required = field_name in required
+
+        prompt = f"{field_name} ({field_type})"
+        if not is_required:
+            prompt += " [optional]"
+        prompt += ": "
+
+        while True:
+            user_input = input(prompt)
+
+            if not user_input:
+                if is_required:
+                    print(f"  Error: {field_name} is required")
+                    continue
+                break
+
+            try:
+                content[field_name] = _coerce(field_type, user_input)
+            except ValueError:
+                print(f"  Error: Expected {field_type}, try again")
+                continue
+            break
+
+    confirm = input("\nSubmit? [Y/n/cancel]: ")
+    return content, confirm
+
+
 async def elicitation_handler(
     _context: object, params: ElicitRequestParams
 ) -> ElicitResult | ErrorData:
@@ -61,41 +108,7 @@ async def elicitation_handler(
         properties = schema.get("properties", {})
         required = schema.get("required", [])
 
-        content: dict[str, object] = {}
-        for field_name, field_schema in properties.items():
-            field_type = field_schema.get("type", "string")
-            is_required = field_name in required
-
-            prompt = f"{field_name} ({field_type})"
-            if not is_required:
-                prompt += " [optional]"
-            prompt += ": "
-
-            while True:
-                try:
-                    user_input = await anyio.to_thread.run_sync(input, prompt)
-
-                    if not user_input:
-                        if is_required:
-                            print(f"  Error: {field_name} is required")
-                            continue
-                        break
-
-                    if field_type == "boolean":
-                        content[field_name] = user_input.lower() in ("true", "yes", "1", "y")
-                    elif field_type == "integer":
-                        content[field_name] = int(user_input)
-                    elif field_type == "number":
-                        content[field_name] = float(user_input)
-                    else:
-                        content[field_name] = user_input
-
-                    break
-
-                except ValueError:
-                    print(f"  Error: Expected {field_type}, try again")
-
-        confirm = await anyio.to_thread.run_sync(input, "\nSubmit? [Y/n/cancel]: ")
+        content, confirm = await anyio.to_thread.run_sync(_prompt_all, properties, required)
 
         if confirm.lower() == "cancel":
             return ElicitResult(action="cancel", content={})
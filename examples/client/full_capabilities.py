@@ -18,11 +18,12 @@ Run: export ANTHROPIC_API_KEY=your-key && uv run python examples/client/full_cap
 
 from __future__ import annotations
 
+import functools
 import os
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import anyio
-import anthropic
 
 from openmcp.client import ClientCapabilitiesConfig, open_connection
 from openmcp.types import (
@@ -41,21 +42,32 @@ from openmcp.types import (
     TextContent,
 )
 
+if TYPE_CHECKING:
+    import anthropic
+
 
 SERVER_URL = "http://127.0.0.1:8000/mcp"
 
 
+@functools.cache
+def _anthropic_client() -> anthropic.AsyncAnthropic:
+    """Import the SDK and build one pooled client on the first sampling request."""
+    import anthropic
+
+    return anthropic.AsyncAnthropic(api_key=os.environ["ANTHROPIC_API_KEY"])
+
+
 async def sampling_handler(
     _context: object, params: CreateMessageRequestParams
 ) -> CreateMessageResult | ErrorData:
     """Handle sampling requests with Anthropic API."""
     try:
-        client = anthropic.AsyncAnthropic(api_key=os.environ["ANTHROPIC_API_KEY"])
+        client = _anthropic_client()
 
         messages = [
             {
                 "role": msg.role,
-                "content": msg.content.text if hasattr(msg.content, "text") else str(msg.content),
+                "content": msg.content.text if isinstance(msg.content, TextContent) else str(msg.content),
             }
             for msg in params.messages
         ]
@@ -142,7 +154,11 @@ async def main() -> None:
             print(f"  - {tool.name}: {tool.description or 'no description'}")
 
         print("\nClient ready. Server can now use all advertised capabilities.")
-        await anyio.sleep(30)
+        try:
+            await anyio.sleep(30)
+        finally:
+            if _anthropic_client.cache_info().currsize:
+                await _anthropic_client().close()
 
 
 if __name__ == "__main__":
@@ -44,8 +44,10 @@ SERVER_URL = "http://127.0.0.1:8000/mcp"
 
 async def main() -> None:
     """Connect to a server with filesystem roots configured."""
-    project_root = Path.cwd()
-    temp_dir = Path("/tmp")
+    # Advertise canonical paths (e.g. /tmp -> /private/tmp on macOS) so the
+    # server's guard compares against the real locations it will resolve to.
+    project_root = Path.cwd().resolve()
+    temp_dir = Path("/tmp").resolve()
 
     initial_roots = [
         Root(uri=project_root.as_uri(), name="Project Directory"),
@@ -70,7 +72,7 @@ async def main() -> None:
         await anyio.sleep(2)
         print("\nAdding new root...")
 
-        new_roots = initial_roots + [Root(uri=Path.home().as_uri(), name="Home Directory")]
+        new_roots = initial_roots + [Root(uri=Path.home().resolve().as_uri(), name="Home Directory")]
         await client.update_roots(new_roots, notify=True)
 
         print("Updated roots:")
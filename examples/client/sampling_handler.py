@@ -32,10 +32,12 @@ Run with:
 
 from __future__ import annotations
 
+import functools
 import os
 
 import anyio
 import anthropic
+import httpx
 
 from openmcp.client import ClientCapabilitiesConfig, open_connection
 from openmcp.types import (
@@ -49,55 +51,70 @@ from openmcp.types import (
 
 
 SERVER_URL = "http://127.0.0.1:8000/mcp"
+# Resolved once at import: a missing key fails at startup, not mid-sample.
+ANTHROPIC_API_KEY = os.environ["ANTHROPIC_API_KEY"]
+
+
+@functools.cache
+def _anthropic_client() -> anthropic.AsyncAnthropic:
+    """Build one client on first use so every sample shares its connection pool."""
+    return anthropic.AsyncAnthropic(api_key=ANTHROPIC_API_KEY)
 
 
 async def sampling_handler(
     _context: object, params: CreateMessageRequestParams
 ) -> CreateMessageResult | ErrorData:
     """Handle sampling/createMessage requests by invoking Anthropic API."""
+    client = _anthropic_client()
+    messages = [
+        {
+            "role": msg.role,
+            "content": msg.content.text if isinstance(msg.content, TextContent) else str(msg.content),
+        }
+        for msg in params.messages
+    ]
+
+    model = "claude-3-5-sonnet-20241022"
+    if params.modelPreferences and params.modelPreferences.hints:
+        model = params.modelPreferences.hints[0].name
+
+    # Only provider/transport failures become ErrorData; programming errors
+    # propagate so they show up with a traceback instead of a vague message.
     try:
-        client = anthropic.AsyncAnthropic(api_key=os.environ["ANTHROPIC_API_KEY"])
-
-        messages = [
-            {
-                "role": msg.role,
-                "content": msg.content.text if hasattr(msg.content, "text") else str(msg.content),
-            }
-            for msg in params.messages
-        ]
-
-        model = "claude-3-5-sonnet-20241022"
-        if params.modelPreferences and params.modelPreferences.hints:
-            model = params.modelPreferences.hints[0].name
-
         response = await client.messages.create(
             model=model, messages=messages, max_tokens=params.maxTokens or 1024
         )
-
-        text_content = response.content[0].text if response.content else ""
-        return CreateMessageResult(
-            model=response.model,
-            content=TextContent(type="text", text=text_content),
-            role=Role.assistant,
-            stopReason=(
-                StopReason.endTurn if response.stop_reason == "end_turn" else StopReason.maxTokens
-            ),
-        )
-
-    except Exception as e:
+    except (anthropic.APIError, httpx.HTTPError) as e:
         return ErrorData(code=-32603, message=f"Sampling failed: {e}")
 
+    text_content = response.content[0].text if response.content else ""
+    return CreateMessageResult(
+        model=response.model,
+        content=TextContent(type="text", text=text_content),
+        role=Role.assistant,
+        stopReason=(
+            StopReason.endTurn if response.stop_reason == "end_turn" else StopReason.maxTokens
+        ),
+    )
+
 
 async def main() -> None:
     """Connect to a server that uses sampling and handle its requests."""
-    capabilities = ClientCapabilitiesConfig(sampling=sampling_handler)
+    # Let concurrent ctx.sample() calls from the server reach the API in parallel.
+    capabilities = ClientCapabilitiesConfig(sampling=sampling_handler, sampling_concurrency=32)
 
     async with open_connection(
         url=SERVER_URL, transport="streamable-http", capabilities=capabilities
     ) as client:
+        # One connection for the process lifetime: sampling requests and any
+        # client calls share its keep-alive pool instead of reconnecting.
         print("Connected with sampling capability enabled")
         print(f"Server info: {client.initialize_result.serverInfo.name}")
-        await anyio.sleep(60)
+        try:
+            await anyio.sleep(60)
+        finally:
+            if _anthropic_client.cache_info().currsize:
+                await _anthropic_client().close()
 
 
 if __name__ == "__main__":
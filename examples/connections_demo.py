@@ -89,6 +89,8 @@ def demo_serialization() -> None:
         print(f"  Description: {json_output['description']}")
         print(f"  Parameters: {list(json_output['params'].keys())}")
         print(f"  Auth methods: {json_output['auth_methods']}")
+        # Pre-encoded once at define() time; serve as-is with the ETag for 304s.
+        print(f"  Payload: {len(conn_type.wellknown_bytes)} bytes, ETag {conn_type.wellknown_etag}")
 
 
 def demo_validation_errors() -> None:
@@ -13,8 +13,11 @@ payloads that update the allow-list and register new inline tools on the fly.
 Pattern:
 1. Server starts with permissive allow-list (all tools visible)
 2. POST JSON config to the webhook endpoint to update tool registry
-3. Server calls `notify_tools_list_changed()` to inform connected clients
-4. Clients re-fetch tool list to discover new/removed tools
+3. Payloads are shape-checked before the 204 (malformed ones get 400, a full
+   queue gets 503); webhooks arriving within ``RECONCILE_BATCH_SECONDS`` are
+   merged into one reconcile pass, so a burst costs one registry rebuild
+4. Server calls `notify_tools_list_changed()` to inform connected clients
+5. Clients re-fetch tool list to discover new/removed tools
 
 Use cases:
 - Feature flag rollouts that add/remove tools without deployment
@@ -41,6 +44,7 @@ Usage:
 
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
 import json
 import logging
 from typing import Any
@@ -48,6 +52,7 @@ from typing import Any
 import anyio
 from anyio import create_task_group
 from anyio.abc import SocketStream
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 
 from openmcp import MCPServer, tool
 
@@ -55,7 +60,25 @@ from openmcp import MCPServer, tool
 for logger_name in ("mcp", "httpx", "uvicorn", "uvicorn.access", "uvicorn.error"):
     logging.getLogger(logger_name).setLevel(logging.CRITICAL)
 
-server = MCPServer("webhook-driven", instructions="Hot-reload tools from controller")
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# Both parsers accept the raw bytes, so no intermediate str is decoded.
+_loads = orjson.loads if orjson is not None else json.loads
+
+logger = logging.getLogger(__name__)
+
+_RESPONSE_204 = b"HTTP/1.1 204 No Content\r\nContent-Length: 0\r\n\r\n"
+_RESPONSE_400 = b"HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\n\r\n"
+_RESPONSE_503 = b"HTTP/1.1 503 Service Unavailable\r\nContent-Length: 0\r\n\r\n"
+
+RECONCILE_BATCH_SECONDS = 0.05
+# Configs waiting for the reconcile worker; further webhooks get 503 until it catches up.
+MAX_PENDING_CONFIGS = 64
+
+server = MCPServer("webhook-driven", instructions="Hot-reload tools from controller", allow_dynamic_tools=True)
 server.allow_tools(None)  # start in permissive mode
 
 # Register a baseline tool to demonstrate allow-list filtering
@@ -66,6 +89,14 @@ with server.binding():
         return "ok"
 
 
+def _make_dynamic_tool(name: str) -> Callable[..., Awaitable[dict[str, Any]]]:
+    async def dynamic_tool(**kwargs: Any) -> dict[str, Any]:
+        return {"name": name, "args": kwargs}
+
+    dynamic_tool.__name__ = name
+    return dynamic_tool
+
+
 async def reconcile_tools(config: dict[str, Any]) -> None:
     """Update server tool registry from external configuration.
 
@@ -73,33 +104,87 @@ async def reconcile_tools(config: dict[str, Any]) -> None:
         config: Dict with "allow" (list of tool names or None) and
                 "inline_tools" (list of tool specs with name/tags)
     """
-    allow = set(config.get("allow", [])) or None
-    server.allow_tools(allow)
+    allow = config.get("allow")
+    server.allow_tools(set(allow) if allow else None)
+
+    # Dynamically define or update inline tools from the payload, then register
+    # them in one batch so the registry is rebuilt once rather than per tool.
+    inline_tools = [
+        tool(name=spec["name"], tags=set(spec.get("tags", ())))(_make_dynamic_tool(spec["name"]))
+        for spec in config.get("inline_tools", [])
+    ]
+    server.register_tools(inline_tools)
 
-    # Dynamically define or update inline tools from the payload
-    for spec in config.get("inline_tools", []):
-        name = spec["name"]
-        tags = set(spec.get("tags", ()))
+    await server.notify_tools_list_changed()
 
-        async def dynamic_tool(**kwargs: Any) -> dict[str, Any]:
-            return {"name": name, "args": kwargs}
 
-        dynamic_tool.__name__ = name
-        with server.binding():
-            tool(name=name, tags=tags)(dynamic_tool)
+def _merge_configs(batch: list[dict[str, Any]]) -> dict[str, Any]:
+    """Collapse queued configs into the state applying them in order would leave."""
+    inline_tools: dict[str, dict[str, Any]] = {}
+    for config in batch:
+        for spec in config.get("inline_tools", []):
+            inline_tools[spec["name"]] = spec
+    return {"allow": batch[-1].get("allow"), "inline_tools": list(inline_tools.values())}
 
-    await server.notify_tools_list_changed()
 
+def _parse_config(data: bytes) -> dict[str, Any]:
+    """Decode and shape-check a webhook payload before it is acknowledged.
 
-async def webhook_listener(port: int) -> None:
+    Raises:
+        ValueError: If the payload is not JSON or does not match the config format.
+    """
+    config = _loads(data)  # JSONDecodeError and orjson.JSONDecodeError subclass ValueError
+    if not isinstance(config, dict):
+        raise ValueError("config must be a JSON object")
+    allow = config.get("allow")
+    if allow is not None and not (isinstance(allow, list) and all(isinstance(name, str) for name in allow)):
+        raise ValueError("allow must be null or a list of tool names")
+    specs = config.get("inline_tools", [])
+    if not isinstance(specs, list):
+        raise ValueError("inline_tools must be a list")
+    for spec in specs:
+        if not isinstance(spec, dict) or not isinstance(spec.get("name"), str) or not spec["name"]:
+            raise ValueError("each inline tool needs a non-empty string name")
+        tags = spec.get("tags", [])
+        if not isinstance(tags, list) or not all(isinstance(tag, str) for tag in tags):
+            raise ValueError("inline tool tags must be a list of strings")
+    return config
+
+
+async def reconcile_worker(configs: MemoryObjectReceiveStream[dict[str, Any]]) -> None:
+    """Apply queued webhook configs, one reconcile pass per burst."""
+    async with configs:
+        async for config in configs:
+            await anyio.sleep(RECONCILE_BATCH_SECONDS)
+            batch = [config]
+            while True:
+                try:
+                    batch.append(configs.receive_nowait())
+                except anyio.WouldBlock:
+                    break
+            # A failed pass must not take the MCP server down with the worker.
+            try:
+                await reconcile_tools(_merge_configs(batch))
+            except Exception:
+                logger.exception("reconcile failed for %d queued config(s)", len(batch))
+
+
+async def webhook_listener(port: int, configs: MemoryObjectSendStream[dict[str, Any]]) -> None:
     """Listen for JSON payloads on a raw TCP socket to update tool config."""
 
     async def handle_client(stream: SocketStream) -> None:
         data = await stream.receive(65536)
-        payload = data.decode("utf-8")
-        config = json.loads(payload)
-        await reconcile_tools(config)
-        await stream.send(b"HTTP/1.1 204 No Content\r\n\r\n")
+        try:
+            config = _parse_config(data)
+        except ValueError:
+            await stream.send(_RESPONSE_400)
+            return
+        try:
+            configs.send_nowait(config)
+        except anyio.WouldBlock:
+            await stream.send(_RESPONSE_503)
+            return
+        await stream.send(_RESPONSE_204)
 
     listeners = await anyio.create_tcp_listener(local_host="127.0.0.1", local_port=port)
     async with listeners:
@@ -107,9 +192,11 @@ async def webhook_listener(port: int) -> None:
 
 
 async def main() -> None:
+    send_configs, receive_configs = anyio.create_memory_object_stream[dict[str, Any]](MAX_PENDING_CONFIGS)
     async with create_task_group() as tg:
         tg.start_soon(server.serve, "streamable-http", False, "critical")
-        tg.start_soon(webhook_listener, 9000)
+        tg.start_soon(reconcile_worker, receive_configs)
+        tg.start_soon(webhook_listener, 9000, send_configs)
 
 
 if __name__ == "__main__":
@@ -23,19 +23,28 @@ from __future__ import annotations
 
 from collections.abc import Awaitable, Callable, Iterable
 from dataclasses import dataclass
-from typing import Any, TypeVar
+import time
+from typing import TYPE_CHECKING, Any, TypeVar
 
-from anyio import Lock
+import anyio
+from anyio import CapacityLimiter, Lock
 from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 
 from .._sdk_loader import ensure_sdk_importable
+from ..utils import get_logger
 from ..utils.coro import maybe_await_with_args
 
 
 ensure_sdk_importable()
 
 from mcp import types
-from mcp.client.session import ClientSession
+from mcp.client.session import ClientResponse, ClientSession
+from mcp.shared.context import RequestContext
+
+
+if TYPE_CHECKING:
+    from anyio.abc import TaskStatus
+    from mcp.shared.session import RequestResponder
 
 
 SamplingHandler = Callable[
@@ -50,6 +59,8 @@ LoggingHandler = Callable[[types.LoggingMessageNotificationParams], Awaitable[No
 
 T_RequestResult = TypeVar("T_RequestResult")
 
+_logger = get_logger("openmcp.client")
+
 
 @dataclass(slots=True)
 class ClientCapabilitiesConfig:
@@ -60,6 +71,110 @@ class ClientCapabilitiesConfig:
     logging: LoggingHandler | None = None
     initial_roots: Iterable[types.Root | dict[str, Any]] | None = None
     enable_roots: bool = False
+    # Max sampling requests answered at once; 1 keeps them inline on the receive loop.
+    sampling_concurrency: int = 1
+    # Optional local shaping of sampling calls: sustained requests/second plus burst size.
+    # Setting a rate always answers sampling off the receive loop, so waiting for
+    # a token never stalls responses, pings, or cancellations.
+    sampling_rate_limit: float | None = None
+    sampling_burst: int = 1
+
+
+class _TokenBucket:
+    """Token bucket that delays callers instead of rejecting them.
+
+    Each ``acquire`` reserves a token up front, letting the balance go
+    negative, and sleeps off its share of the debt.  Reservation happens
+    without awaiting, so concurrent callers are admitted in arrival order
+    and no refill task is needed.
+    """
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self._rate = rate
+        self._capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+        self._tokens -= 1.0
+        if self._tokens < 0:
+            try:
+                await anyio.sleep(-self._tokens / self._rate)
+            except anyio.get_cancelled_exc_class():
+                # The reservation was never used; hand it back to later callers.
+                self._tokens += 1.0
+                raise
+
+
+class _ConcurrentSamplingSession(ClientSession):
+    """``ClientSession`` that answers ``sampling/createMessage`` off the receive loop.
+
+    The reference session awaits every server request inline, so a second
+    sampling request waits for the first completion to finish.  Here sampling
+    requests run on the session task group, bounded by a capacity limiter and
+    an optional token bucket, while other traffic keeps flowing.
+
+    Note:
+        This overrides the SDK's private ``_received_request`` hook and spawns
+        onto its private ``_task_group``.  Both match ``mcp`` 1.20; re-check
+        this class whenever the ``mcp`` lower bound in ``pyproject.toml`` moves.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        sampling_concurrency: int,
+        sampling_bucket: _TokenBucket | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self._sampling_limiter = CapacityLimiter(sampling_concurrency)
+        self._sampling_bucket = sampling_bucket
+
+    async def _received_request(self, responder: RequestResponder[types.ServerRequest, types.ClientResult]) -> None:
+        if isinstance(responder.request.root, types.CreateMessageRequest):
+            # ``start`` returns once the task has entered the responder, so a
+            # ``notifications/cancelled`` read afterwards can always cancel it.
+            await self._task_group.start(self._respond_to_sampling, responder)
+            return
+        await super()._received_request(responder)
+
+    async def _respond_to_sampling(
+        self,
+        responder: RequestResponder[types.ServerRequest, types.ClientResult],
+        *,
+        task_status: TaskStatus[None] = anyio.TASK_STATUS_IGNORED,
+    ) -> None:
+        ctx = RequestContext[ClientSession, Any](
+            request_id=responder.request_id,
+            meta=responder.request_meta,
+            session=self,
+            lifespan_context=None,
+        )
+        # Enter the responder first so a cancellation also aborts the wait for a slot.
+        with responder:
+            task_status.started()
+            if self._sampling_bucket is not None:
+                await self._sampling_bucket.acquire()
+            async with self._sampling_limiter:
+                # Failures must not escape: this task runs on the session task
+                # group, where an exception would tear down the whole session.
+                try:
+                    response = await self._sampling_callback(ctx, responder.request.root.params)
+                    result = ClientResponse.validate_python(response)
+                except Exception as exc:
+                    result = types.ErrorData(code=types.INTERNAL_ERROR, message=f"Sampling failed: {exc}")
+                try:
+                    await responder.respond(result)
+                except Exception:
+                    _logger.exception("failed to send sampling response", extra={"request_id": responder.request_id})
 
 
 class MCPClient:
@@ -102,15 +217,25 @@ class MCPClient:
     # ---------------------------------------------------------------------
 
     async def __aenter__(self) -> MCPClient:
-        session = ClientSession(
-            self._read_stream,
-            self._write_stream,
-            sampling_callback=self._build_sampling_handler(),
-            elicitation_callback=self._build_elicitation_handler(),
-            list_roots_callback=self._build_roots_handler(),
-            logging_callback=self._build_logging_handler(),
-            client_info=self._client_info,
-        )
+        session_kwargs: dict[str, Any] = {
+            "sampling_callback": self._build_sampling_handler(),
+            "elicitation_callback": self._build_elicitation_handler(),
+            "list_roots_callback": self._build_roots_handler(),
+            "logging_callback": self._build_logging_handler(),
+            "client_info": self._client_info,
+        }
+        rate_limit = self._config.sampling_rate_limit
+        if self._config.sampling is not None and (self._config.sampling_concurrency > 1 or rate_limit is not None):
+            bucket = _TokenBucket(rate_limit, self._config.sampling_burst) if rate_limit is not None else None
+            session = _ConcurrentSamplingSession(
+                self._read_stream,
+                self._write_stream,
+                sampling_concurrency=self._config.sampling_concurrency,
+                sampling_bucket=bucket,
+                **session_kwargs,
+            )
+        else:
+            session = ClientSession(self._read_stream, self._write_stream, **session_kwargs)
 
         self._session = await session.__aenter__()
         self.initialize_result = await self._session.initialize()
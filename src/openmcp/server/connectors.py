@@ -19,6 +19,9 @@ Key components:
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import json
 import os
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Literal, TypeVar
@@ -26,6 +29,8 @@ from typing import TYPE_CHECKING, Any, Literal, TypeVar
 from pydantic import BaseModel, create_model
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
+    from collections.abc import Iterable
+
     from .drivers import Driver
 
 _UNSET = object()
@@ -128,6 +133,10 @@ class _ConnectorType:
 
     def __init__(self, definition: ConnectorDefinition) -> None:
         self._definition = definition
+        # Definitions are frozen, so flatten the lookup structures validate()
+        # walks once here instead of on every handle.
+        self._param_items = tuple(definition.params.items())
+        self._auth_methods = frozenset(definition.auth_methods)
         fields = {name: (param_type, ...) for name, param_type in definition.params.items()}
         self._config_model = create_model(
             _model_name(definition.kind, "Config"),
@@ -140,6 +149,16 @@ class _ConnectorType:
         """Access the underlying connection definition."""
         return self._definition
 
+    @functools.cached_property
+    def wellknown_bytes(self) -> bytes:
+        """Compact ``definition.to_json()`` for .well-known responses, encoded on first use."""
+        return json.dumps(self._definition.to_json(), separators=(",", ":")).encode()
+
+    @functools.cached_property
+    def wellknown_etag(self) -> str:
+        """Quoted strong ETag for :attr:`wellknown_bytes`, for conditional GETs."""
+        return f'"{hashlib.blake2b(self.wellknown_bytes, digest_size=8).hexdigest()}"'
+
     @property
     def config_model(self) -> type[BaseModel]:
         """Return the Pydantic model for this connector's configuration."""
@@ -163,25 +182,41 @@ class _ConnectorType:
         if handle.kind != self._definition.kind:
             raise ValueError(f"expected kind '{self._definition.kind}', got '{handle.kind}'")
 
+        config = handle.config
+
         # Validate all required params are present
-        missing = set(self._definition.params.keys()) - set(handle.config.keys())
+        missing = [name for name, _ in self._param_items if name not in config]
         if missing:
             raise ValueError(f"missing required params: {', '.join(sorted(missing))}")
 
         # Validate auth method is supported
-        if handle.auth_type not in self._definition.auth_methods:
+        if handle.auth_type not in self._auth_methods:
             raise ValueError(
                 f"auth_type '{handle.auth_type}' not in supported methods: {', '.join(self._definition.auth_methods)}"
             )
 
-        # Validate param types
-        for param_name, expected_type in self._definition.params.items():
-            value = handle.config[param_name]
-            if not isinstance(value, expected_type):
+        # Validate param types (exact-type check first; isinstance covers subclasses)
+        for param_name, expected_type in self._param_items:
+            value = config[param_name]
+            if type(value) is not expected_type and not isinstance(value, expected_type):
                 raise TypeError(
                     f"param '{param_name}' expected {expected_type.__name__}, got {type(value).__name__}"
                 )
 
+    def validate_many(self, handles: Iterable[ConnectorHandle]) -> None:
+        """Validate several connection handles, raising on the first invalid one.
+
+        Args:
+            handles: Connection handles to validate
+
+        Raises:
+            ValueError: If a handle doesn't match definition requirements
+            TypeError: If a handle parameter has the wrong type
+        """
+        validate = self.validate
+        for handle in handles:
+            validate(handle)
+
     def __repr__(self) -> str:
         return f"ConnectionType(kind={self._definition.kind!r})"
 
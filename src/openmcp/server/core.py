@@ -431,6 +431,9 @@ class MCPServer(Server[Any, Any]):
     def register_tool(self, target: ToolSpec | Callable[..., Any]) -> ToolSpec:
         return self.tools.register(target)
 
+    def register_tools(self, targets: Iterable[ToolSpec | Callable[..., Any]]) -> list[ToolSpec]:
+        return self.tools.register_many(targets)
+
     def allow_tools(self, names: Iterable[str] | None) -> None:
         self.tools.allow_tools(names)
 
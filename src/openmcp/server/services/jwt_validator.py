@@ -16,9 +16,13 @@ Implements RFC 9068 JWT Profile for OAuth 2.0 Access Tokens with:
 
 from __future__ import annotations
 
+from collections import deque
 import time
 from dataclasses import dataclass, field
-from typing import Any, Protocol
+from typing import TYPE_CHECKING, Any, Protocol
+
+import anyio
+
 
 try:
     import httpx
@@ -34,6 +38,10 @@ from ..authorization import AuthorizationContext, AuthorizationError, Authorizat
 from ...utils import get_logger
 
 
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
+
 class Clock(Protocol):
     """Clock abstraction for testing time-dependent logic."""
 
@@ -99,10 +107,10 @@ class JWTValidatorConfig:
     jwks_uri: str
     """JWKS endpoint URI (e.g., https://as.dedaluslabs.ai/.well-known/jwks.json)"""
 
-    issuer: str | list[str] | None = None
+    issuer: str | Collection[str] | None = None
     """Expected issuer(s) for iss claim validation"""
 
-    audience: str | list[str] | None = None
+    audience: str | Collection[str] | None = None
     """Expected audience(s) for aud claim validation (RFC 8707)"""
 
     required_scopes: list[str] = field(default_factory=list)
@@ -117,10 +125,25 @@ class JWTValidatorConfig:
     jwks_cache_ttl: float = 3600.0
     """JWKS cache TTL in seconds (default: 1 hour)"""
 
+    jwks_requests_per_minute: int = 10
+    """Maximum JWKS fetches per rolling minute; 0 disables the limit"""
+
     clock: Clock = field(default_factory=SystemClock)
     """Clock for time operations (injectable for testing)"""
 
 
+# Back-off between JWKS refetch attempts while serving stale keys.
+_STALE_RETRY_SECONDS = 30.0
+
+
+def _as_frozenset(value: str | Collection[str] | None) -> frozenset[str] | None:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return frozenset((value,))
+    return frozenset(value)
+
+
 class JWTValidator(AuthorizationProvider):
     """JWT validation provider implementing RFC 9068.
 
@@ -151,10 +174,34 @@ class JWTValidator(AuthorizationProvider):
         self.config = config
         self._logger = get_logger("openmcp.jwt_validator")
 
+        # Expected iss/aud values are fixed per validator; normalize them once
+        # so claim checks are set lookups.
+        self._issuers = _as_frozenset(config.issuer)
+        self._audiences = _as_frozenset(config.audience)
+        self._required_scopes = frozenset(config.required_scopes)
+
         # Manual JWKS cache: kid -> (public_key, cached_at)
         self._jwks_cache: dict[str, tuple[Any, float]] = {}
         self._jwks_cache_time: float = 0.0
 
+        # Refreshes are single-flight: concurrent misses wait on one fetch and
+        # re-check the cache instead of each hitting the JWKS endpoint.
+        self._refresh_lock = anyio.Lock()
+        self._http_client: httpx.AsyncClient | None = None
+
+        # Timestamps of recent JWKS fetches.  Tokens carrying unknown kids
+        # force a refresh, so cap the rate to keep them from hammering the AS.
+        self._refresh_times: deque[float] = deque()
+        # After a failed refresh of expired keys, keep serving them without
+        # retrying until this time.
+        self._stale_retry_at: float = 0.0
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client used for JWKS fetches."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
     async def validate(self, token: str) -> AuthorizationContext:
         """Validate JWT access token per RFC 9068.
 
@@ -200,8 +247,8 @@ class JWTValidator(AuthorizationProvider):
 
             # Extract and validate scopes
             scopes = self._extract_scopes(claims)
-            if self.config.required_scopes:
-                self._validate_scopes(scopes, self.config.required_scopes)
+            if self._required_scopes:
+                self._validate_scopes(scopes, self._required_scopes)
 
             return AuthorizationContext(
                 subject=claims.get("sub"),
@@ -225,40 +272,96 @@ class JWTValidator(AuthorizationProvider):
     async def _get_public_key(self, kid: str) -> Any:
         """Fetch public key from JWKS with caching.
 
-        Implements TTL-based caching similar to Clerk SDK pattern.
+        Implements TTL-based caching similar to Clerk SDK pattern.  Cache hits
+        never wait on the network; misses serialize on a refresh lock so only
+        one JWKS fetch is in flight at a time.
         """
-        now = self.config.clock.now()
+        cached_key = self._cached_public_key(kid)
+        if cached_key is not None:
+            return cached_key
+
+        async with self._refresh_lock:
+            # Another task may have refreshed while we waited for the lock.
+            cached_key = self._cached_public_key(kid)
+            if cached_key is not None:
+                return cached_key
+            return await self._refresh_for_kid(kid)
 
+    def _cached_public_key(self, kid: str) -> Any | None:
         cached_entry = self._jwks_cache.get(kid)
-        if cached_entry is not None:
-            cached_key, cached_at = cached_entry
-            if now - cached_at < self.config.jwks_cache_ttl:
-                return cached_key
-            # Expired entry – drop so we refetch below.
-            self._jwks_cache.pop(kid, None)
+        if cached_entry is None:
+            return None
+        cached_key, cached_at = cached_entry
+        if self.config.clock.now() - cached_at < self.config.jwks_cache_ttl:
+            return cached_key
+        return None
 
-        needs_refresh = (
-            cached_entry is None
-            or now - self._jwks_cache_time >= self.config.jwks_cache_ttl
-        )
+    async def _refresh_for_kid(self, kid: str) -> Any:
+        now = self.config.clock.now()
+        stale_entry = self._jwks_cache.get(kid)
 
-        if needs_refresh:
+        if stale_entry is None:
+            # Unknown kids come straight from untrusted token headers, so only
+            # these lookups draw on the refresh budget.
+            self._check_refresh_budget(kid, now)
             await self._refresh_jwks_cache()
             self._jwks_cache_time = now
+            refreshed = self._jwks_cache.get(kid)
+            if refreshed is not None:
+                return refreshed[0]
+            raise PublicKeyNotFoundError(f"public key not found for kid: {kid}")
+
+        # A known key reached its TTL.  It stays usable until a successful
+        # refetch proves the authorization server dropped it.
+        if now < self._stale_retry_at:
+            return stale_entry[0]
+        if now - self._jwks_cache_time < self.config.jwks_cache_ttl:
+            # The key set was refreshed recently without this kid: rotated out.
+            del self._jwks_cache[kid]
+            raise PublicKeyNotFoundError(f"public key not found for kid: {kid}")
 
-        refreshed = self._jwks_cache.get(kid)
-        if refreshed is not None:
-            return refreshed[0]
-
-        raise PublicKeyNotFoundError(f"public key not found for kid: {kid}")
+        try:
+            await self._refresh_jwks_cache()
+        except JWKSFetchError:
+            self._stale_retry_at = now + _STALE_RETRY_SECONDS
+            self._logger.warning(
+                "serving stale JWKS key after failed refresh",
+                extra={"event": "jwks.cache.stale", "kid": kid},
+            )
+            return stale_entry[0]
+        self._jwks_cache_time = now
+
+        refreshed = self._jwks_cache[kid]
+        if refreshed is stale_entry:
+            del self._jwks_cache[kid]
+            raise PublicKeyNotFoundError(f"public key not found for kid: {kid}")
+        return refreshed[0]
+
+    def _check_refresh_budget(self, kid: str, now: float) -> None:
+        """Reject an unknown-kid lookup without fetching once the JWKS rate limit is spent."""
+        limit = self.config.jwks_requests_per_minute
+        if limit <= 0:
+            return
+
+        recent = self._refresh_times
+        while recent and now - recent[0] >= 60.0:
+            recent.popleft()
+        if len(recent) >= limit:
+            self._logger.warning(
+                "JWKS refresh rate limit reached",
+                extra={"event": "jwks.refresh.rate_limited", "kid": kid, "limit": limit},
+            )
+            raise PublicKeyNotFoundError(f"public key not found for kid: {kid}")
+        recent.append(now)
 
     async def _refresh_jwks_cache(self) -> None:
         """Fetch and cache all keys from JWKS endpoint."""
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(self.config.jwks_uri)
-                response.raise_for_status()
-                jwks_data = response.json()
+            if self._http_client is None:
+                self._http_client = httpx.AsyncClient(timeout=10.0)
+            response = await self._http_client.get(self.config.jwks_uri)
+            response.raise_for_status()
+            jwks_data = response.json()
 
             # Cache all keys by kid
             now = self.config.clock.now()
@@ -322,16 +425,15 @@ class JWTValidator(AuthorizationProvider):
             if now < nbf_ts - self.config.leeway:
                 raise NotYetValidTokenError("token not yet valid")
 
-        if self.config.issuer is not None:
-            issuers = self.config.issuer if isinstance(self.config.issuer, list) else [self.config.issuer]
-            if claims.get("iss") not in issuers:
-                raise InvalidIssuerError(f"invalid issuer: {claims.get('iss')}")
+        if self._issuers is not None:
+            iss = claims.get("iss")
+            if not isinstance(iss, str) or iss not in self._issuers:
+                raise InvalidIssuerError(f"invalid issuer: {iss}")
 
-        if self.config.audience is not None:
-            audiences = self.config.audience if isinstance(self.config.audience, list) else [self.config.audience]
+        if self._audiences is not None:
             aud_claim = claims.get("aud")
             token_auds = aud_claim if isinstance(aud_claim, list) else [aud_claim] if aud_claim else []
-            if not any(audience in audiences for audience in token_auds):
+            if not any(isinstance(audience, str) and audience in self._audiences for audience in token_auds):
                 raise InvalidAudienceError(f"invalid audience: {aud_claim}")
 
     def _as_timestamp(self, value: Any) -> float | None:
@@ -379,7 +481,7 @@ class JWTValidator(AuthorizationProvider):
 
         return []
 
-    def _validate_scopes(self, granted: list[str], required: list[str]) -> None:
+    def _validate_scopes(self, granted: list[str], required: frozenset[str]) -> None:
         """Validate token has required scopes.
 
         Args:
@@ -389,12 +491,9 @@ class JWTValidator(AuthorizationProvider):
         Raises:
             AuthorizationError: If required scopes not present
         """
-        granted_set = set(granted)
-        required_set = set(required)
-
-        if not required_set.issubset(granted_set):
-            missing = required_set - granted_set
-            raise MissingScopeError(f"insufficient scopes, missing: {missing}")
+        missing = required.difference(granted)
+        if missing:
+            raise MissingScopeError(f"insufficient scopes, missing: {set(missing)}")
 
 
 __all__ = [
@@ -61,12 +61,20 @@ class RootGuard:
 
     def __init__(self, roots: Snapshot) -> None:
         self._paths = tuple(self._canonicalize(root.uri) for root in roots)
+        # Roots are canonicalized once per snapshot; keep them as separator-
+        # terminated prefixes so each check is a string scan rather than a walk
+        # over every parent of the candidate.
+        self._prefixes = tuple(self._as_prefix(str(root)) for root in self._paths)
 
     def within(self, candidate: Path | str) -> bool:
-        if not self._paths:
+        if not self._prefixes:
             return False
-        path = self._canonicalize(candidate)
-        return any(path == root or root in path.parents for root in self._paths)
+        path = self._as_prefix(str(self._canonicalize(candidate)))
+        return any(path.startswith(prefix) for prefix in self._prefixes)
+
+    @staticmethod
+    def _as_prefix(path: str) -> str:
+        return path if path.endswith(os.sep) else path + os.sep
 
     @staticmethod
     def _canonicalize(value: Path | str) -> Path:
@@ -65,6 +65,10 @@ class ToolsService:
         self._pagination_limit = pagination_limit
         self._tool_specs: dict[str, ToolSpec] = {}
         self._tool_defs: dict[str, types.Tool] = {}
+        # Immutable (spec, definition) pairs published by _refresh_tools.  list_tools
+        # awaits per-request predicates while iterating, so it must read a snapshot
+        # that a concurrent registration cannot mutate halfway through.
+        self._listing: tuple[tuple[ToolSpec, types.Tool], ...] = ()
         self._attached_names: set[str] = set()
         self._allow: set[str] | None = None
         self.observers = ObserverRegistry(notification_sink)
@@ -82,21 +86,22 @@ class ToolsService:
         return self._tool_defs
 
     def register(self, target: ToolSpec | Callable[..., Any]) -> ToolSpec:
-        spec: ToolSpec | None
-        if isinstance(target, ToolSpec):
-            spec = target
-        else:
-            fn = target
-            spec = extract_tool_spec(fn)
-            if spec is None:
-                spec = ToolSpec(name=getattr(fn, "__name__", "anonymous"), fn=fn)
-
-        assert spec is not None  # narrow for mypy
+        spec = self._as_spec(target)
         self._tool_specs[spec.name] = spec
         self._server.record_tool_mutation(operation="register")
         self._refresh_tools()
         return spec
 
+    def register_many(self, targets: Iterable[ToolSpec | Callable[..., Any]]) -> list[ToolSpec]:
+        """Register several tools with one mutation record and one registry rebuild."""
+        specs = [self._as_spec(target) for target in targets]
+        if not specs:
+            return specs
+        self._server.record_tool_mutation(operation="register")
+        self._tool_specs.update((spec.name, spec) for spec in specs)
+        self._refresh_tools()
+        return specs
+
     def allow_tools(self, names: Iterable[str] | None) -> None:
         self._allow = set(names) if names is not None else None
         self._server.record_tool_mutation(operation="allow_tools")
@@ -109,10 +114,7 @@ class ToolsService:
                 cursor = request.params.cursor
 
             filtered: list[types.Tool] = []
-            for name, tool_def in self._tool_defs.items():
-                spec = self._tool_specs.get(name)
-                if spec is None:
-                    continue
+            for spec, tool_def in self._listing:
                 if not await self._tool_enabled_this_request(spec):
                     continue
                 filtered.append(tool_def)
@@ -158,12 +160,24 @@ class ToolsService:
     # Internal helpers
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _as_spec(target: ToolSpec | Callable[..., Any]) -> ToolSpec:
+        if isinstance(target, ToolSpec):
+            return target
+        spec = extract_tool_spec(target)
+        if spec is None:
+            spec = ToolSpec(name=getattr(target, "__name__", "anonymous"), fn=target)
+        return spec
+
     def _refresh_tools(self) -> None:
         for name in list(self._attached_names):
             self._detach(name)
         self._attached_names.clear()
-        self._tool_defs.clear()
 
+        # Build the new registry off to the side and publish it with plain
+        # assignments, so readers see either the old or the new view.
+        tool_defs: dict[str, types.Tool] = {}
+        listing: list[tuple[ToolSpec, types.Tool]] = []
         for spec in self._tool_specs.values():
             if not self._is_tool_enabled(spec):
                 continue
@@ -191,10 +205,14 @@ class ToolsService:
                 annotations=annotations,
                 icons=icons,
             )
-            self._tool_defs[spec.name] = tool_def
+            tool_defs[spec.name] = tool_def
+            listing.append((spec, tool_def))
             self._attach(spec.name, spec.fn)
             self._attached_names.add(spec.name)
 
+        self._tool_defs = tool_defs
+        self._listing = tuple(listing)
+
     def _is_tool_enabled(self, spec: ToolSpec) -> bool:
         if self._allow is not None and spec.name not in self._allow:
             return False
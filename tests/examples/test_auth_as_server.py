@@ -0,0 +1,74 @@
+# ==============================================================================
+#                  © 2025 Dedalus Labs, Inc. and affiliates
+#                            Licensed under MIT
+#               github.com/dedalus-labs/openmcp-python/LICENSE
+# ==============================================================================
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+import sys
+from types import ModuleType
+
+import httpx
+import pytest
+
+from tests.helpers import DummySession, run_with_context
+
+
+SERVER_PATH = Path(__file__).resolve().parents[2] / "examples" / "auth" / "02_as" / "server.py"
+
+
+@pytest.fixture
+def as_server(monkeypatch: pytest.MonkeyPatch) -> ModuleType:
+    monkeypatch.setenv("SUPABASE_URL", "https://project.supabase.test")
+    monkeypatch.setenv("SUPABASE_SECRET_KEY", "service-key")
+    spec = importlib.util.spec_from_file_location("auth_as_server", SERVER_PATH)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, spec.name, module)  # dataclasses resolve via sys.modules
+    spec.loader.exec_module(module)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        table = request.url.path.rsplit("/", 1)[-1]
+        if table == "broken":
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(200, json=[{"table": table}])
+
+    monkeypatch.setattr(module, "HTTP_CLIENT", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    module._env_credentials.cache_clear()
+    return module
+
+
+def test_select_batch_schema_describes_each_query(as_server: ModuleType) -> None:
+    schema = as_server.server.tools.definitions["supabase_select_batch"].inputSchema
+
+    query_schema = schema["$defs"]["Query"]
+    assert query_schema["required"] == ["table"]
+    assert "pattern" in query_schema["properties"]["table"]
+    assert schema["properties"]["queries"]["maxItems"] == as_server.MAX_BATCH_QUERIES
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "query",
+    [{"columns": "*"}, {"table": "users/../admin"}, {"table": "users", "limit": 0}, {"table": 7}],
+)
+async def test_select_batch_rejects_malformed_queries(as_server: ModuleType, query: dict[str, object]) -> None:
+    tools = as_server.server.tools
+    with pytest.raises(ValueError):
+        await run_with_context(DummySession(), tools.call_tool, "supabase_select_batch", {"queries": [query]})
+
+
+@pytest.mark.anyio
+async def test_select_batch_reports_failed_query_in_place(as_server: ModuleType) -> None:
+    tools = as_server.server.tools
+    queries = [{"table": "users"}, {"table": "broken"}, {"table": "orders", "limit": 2}]
+
+    result = await run_with_context(DummySession(), tools.call_tool, "supabase_select_batch", {"queries": queries})
+
+    users, broken, orders = result.structuredContent["results"]
+    assert users["status"] == 200 and users["body"] == [{"table": "users"}]
+    assert broken["table"] == "broken" and "connection refused" in broken["error"]
+    assert orders["status"] == 200 and orders["url"].endswith("/rest/v1/orders")
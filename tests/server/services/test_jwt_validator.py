@@ -6,6 +6,7 @@
 
 """Tests for JWT validation service."""
 
+import asyncio
 import time
 
 import base64
@@ -15,7 +16,13 @@ from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import rsa
 
 from openmcp.server.authorization import AuthorizationError
-from openmcp.server.services.jwt_validator import Clock, JWTValidator, JWTValidatorConfig, SystemClock
+from openmcp.server.services.jwt_validator import (
+    Clock,
+    JWTValidator,
+    JWTValidatorConfig,
+    PublicKeyNotFoundError,
+    SystemClock,
+)
 
 
 def _b64url_uint(value: int) -> str:
@@ -463,6 +470,24 @@ async def test_audience_list_in_token(httpx_mock, rsa_keypair, mock_jwks_server)
     assert context.subject == "user_123"
 
 
+@pytest.mark.asyncio
+async def test_audience_set_config_rejects_non_string_aud(httpx_mock, rsa_keypair, mock_jwks_server):
+    """Audience may be configured as a set; malformed aud entries are rejected, not crashed on."""
+    config = JWTValidatorConfig(
+        jwks_uri="https://as.example.com/.well-known/jwks.json",
+        issuer="https://as.example.com",
+        audience=frozenset({"https://mcp.example.com", "https://mcp.example.com/mcp"}),
+    )
+
+    validator = JWTValidator(config)
+
+    context = await validator.validate(create_test_token(rsa_keypair, claims={"aud": "https://mcp.example.com/mcp"}))
+    assert context.subject == "user_123"
+
+    with pytest.raises(AuthorizationError, match="invalid audience"):
+        await validator.validate(create_test_token(rsa_keypair, claims={"aud": [{"nested": True}]}))
+
+
 @pytest.mark.asyncio
 async def test_nbf_validation(httpx_mock, rsa_keypair, mock_jwks_server):
     """Test not-before claim validation."""
@@ -570,3 +595,120 @@ async def test_jwks_fetch_failure_raises_error(httpx_mock, rsa_keypair):
 
     with pytest.raises(AuthorizationError, match="failed to fetch JWKS"):
         await validator.validate(token)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_cold_cache_fetches_jwks_once(httpx_mock, rsa_keypair, mock_jwks_server):
+    """Concurrent validations with an empty cache should share one JWKS fetch."""
+    config = JWTValidatorConfig(
+        jwks_uri="https://as.example.com/.well-known/jwks.json",
+        issuer="https://as.example.com",
+        audience="https://mcp.example.com",
+    )
+
+    validator = JWTValidator(config)
+    tokens = [create_test_token(rsa_keypair, claims={"jti": f"jti-{i}"}) for i in range(5)]
+
+    contexts = await asyncio.gather(*(validator.validate(token) for token in tokens))
+    await validator.aclose()
+
+    assert all(context.subject == "user_123" for context in contexts)
+    assert len(httpx_mock.get_requests()) == 1
+
+
+@pytest.mark.asyncio
+async def test_unknown_kid_refreshes_are_rate_limited(httpx_mock, rsa_keypair, mock_jwks_server):
+    """Unknown kids past the per-minute budget fail without hitting the JWKS endpoint."""
+    clock = MockClock()
+    config = JWTValidatorConfig(
+        jwks_uri="https://as.example.com/.well-known/jwks.json",
+        issuer="https://as.example.com",
+        audience="https://mcp.example.com",
+        jwks_requests_per_minute=1,
+        clock=clock,
+    )
+
+    validator = JWTValidator(config)
+    await validator.validate(create_test_token(rsa_keypair, claims={"iat": clock.now(), "exp": clock.now() + 900}))
+
+    alt_keypair = generate_rsa_keypair("rotated-key")
+    rotated_token = create_test_token(
+        alt_keypair, claims={"jti": "rotated", "iat": clock.now(), "exp": clock.now() + 900}
+    )
+
+    with pytest.raises(PublicKeyNotFoundError):
+        await validator.validate(rotated_token)
+    assert len(httpx_mock.get_requests()) == 1
+
+    httpx_mock.add_response(
+        url="https://as.example.com/.well-known/jwks.json",
+        json={"keys": [build_rsa_jwk(alt_keypair["public_key"], alt_keypair["kid"])]},
+    )
+    clock.advance(61)
+
+    context = await validator.validate(rotated_token)
+    await validator.aclose()
+
+    assert context.subject == "user_123"
+    assert len(httpx_mock.get_requests()) == 2
+
+
+@pytest.mark.asyncio
+async def test_unknown_kid_flood_does_not_block_expired_known_key(httpx_mock, rsa_keypair, mock_jwks_server):
+    """Spending the refresh budget on bogus kids must not lock out a known key past its TTL."""
+    clock = MockClock()
+    config = JWTValidatorConfig(
+        jwks_uri="https://as.example.com/.well-known/jwks.json",
+        issuer="https://as.example.com",
+        audience="https://mcp.example.com",
+        jwks_cache_ttl=30.0,
+        jwks_requests_per_minute=2,
+        clock=clock,
+    )
+    httpx_mock.add_response(url="https://as.example.com/.well-known/jwks.json", json=mock_jwks_server)
+    httpx_mock.add_response(url="https://as.example.com/.well-known/jwks.json", json=mock_jwks_server)
+
+    validator = JWTValidator(config)
+    await validator.validate(create_test_token(rsa_keypair, claims={"iat": clock.now(), "exp": clock.now() + 900}))
+
+    for i in range(10):
+        bogus = create_test_token(rsa_keypair, headers={"kid": f"bogus-{i}"})
+        with pytest.raises(PublicKeyNotFoundError):
+            await validator.validate(bogus)
+    assert len(httpx_mock.get_requests()) == 2  # budget spent
+
+    clock.advance(31)  # known key expired, budget window still full
+    token = create_test_token(rsa_keypair, claims={"jti": "after", "iat": clock.now(), "exp": clock.now() + 900})
+    context = await validator.validate(token)
+    await validator.aclose()
+
+    assert context.subject == "user_123"
+    assert len(httpx_mock.get_requests()) == 3
+
+
+@pytest.mark.asyncio
+async def test_expired_known_key_served_stale_when_refresh_fails(httpx_mock, rsa_keypair, mock_jwks_server):
+    """A JWKS outage keeps the last known key in service instead of rejecting valid tokens."""
+    clock = MockClock()
+    config = JWTValidatorConfig(
+        jwks_uri="https://as.example.com/.well-known/jwks.json",
+        issuer="https://as.example.com",
+        audience="https://mcp.example.com",
+        jwks_cache_ttl=300.0,
+        clock=clock,
+    )
+    validator = JWTValidator(config)
+    await validator.validate(create_test_token(rsa_keypair, claims={"iat": clock.now(), "exp": clock.now() + 900}))
+
+    httpx_mock.add_response(url="https://as.example.com/.well-known/jwks.json", status_code=503)
+    clock.advance(301)
+    for i in range(3):
+        token = create_test_token(
+            rsa_keypair, claims={"jti": f"stale-{i}", "iat": clock.now(), "exp": clock.now() + 900}
+        )
+        context = await validator.validate(token)
+        assert context.subject == "user_123"
+    await validator.aclose()
+
+    # One failed refetch, then stale keys are served during the back-off.
+    assert len(httpx_mock.get_requests()) == 2
@@ -8,6 +8,8 @@
 
 from __future__ import annotations
 
+import json
+
 import pytest
 
 from openmcp.server.connectors import (
@@ -368,6 +370,37 @@ class TestConnectionTypeValidation:
         # Should not raise
         conn_type.validate(handle)
 
+    def test_validate_many_raises_on_first_invalid_handle(self) -> None:
+        """Test batch validation stops at the first offending handle."""
+        conn_type = define(
+            kind="postgres",
+            params={"host": str, "port": int},
+            auth=["password"],
+        )
+
+        valid = ConnectorHandle(
+            id="ddls:conn_ok",
+            kind="postgres",
+            config={"host": "localhost", "port": 5432},
+            auth_type="password",
+        )
+        bad_type = ConnectorHandle(
+            id="ddls:conn_bad_type",
+            kind="postgres",
+            config={"host": "localhost", "port": "5432"},
+            auth_type="password",
+        )
+        bad_auth = ConnectorHandle(
+            id="ddls:conn_bad_auth",
+            kind="postgres",
+            config={"host": "localhost", "port": 5432},
+            auth_type="cert",
+        )
+
+        conn_type.validate_many([valid, valid])
+        with pytest.raises(TypeError, match="param 'port' expected int, got str"):
+            conn_type.validate_many([valid, bad_type, bad_auth])
+
 
 class TestConnectionTypeRepr:
     """Test _ConnectorType string representation."""
@@ -417,6 +450,26 @@ class TestIntegration:
         assert "base_url" in json_output["params"]
         assert "service_credential" in json_output["auth_methods"]
 
+    def test_wellknown_bytes_cached(self) -> None:
+        """Test the discovery payload is encoded lazily, once, and matches to_json()."""
+        conn_type = define(
+            kind="http-api",
+            params={"base_url": str},
+            auth=["service_credential"],
+            description="HTTP API connection",
+        )
+
+        assert "wellknown_bytes" not in vars(conn_type)
+        assert json.loads(conn_type.wellknown_bytes) == conn_type.definition.to_json()
+        assert conn_type.wellknown_bytes is conn_type.wellknown_bytes
+        assert conn_type.wellknown_etag.startswith('"') and conn_type.wellknown_etag.endswith('"')
+        assert conn_type.wellknown_etag == define(
+            kind="http-api",
+            params={"base_url": str},
+            auth=["service_credential"],
+            description="HTTP API connection",
+        ).wellknown_etag
+
     def test_multiple_connection_types(self) -> None:
         """Test defining and using multiple connection types."""
         PostgresConn = define(
@@ -7,6 +7,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from types import SimpleNamespace
 from typing import Any
 
 import anyio
@@ -173,3 +174,240 @@ async def test_sampling_and_elicitation_handlers_wrapped(monkeypatch: pytest.Mon
         )
         elicit_result = await session.elicitation_callback(ctx, elicit_params)
         assert isinstance(elicit_result, types.ElicitResult)
+
+
+async def _fake_handshake(server_recv: Any, client_send: Any) -> None:
+    """Answer ``initialize`` and swallow ``notifications/initialized``."""
+    from mcp.shared.message import SessionMessage
+
+    initialize = (await server_recv.receive()).message.root
+    result = types.InitializeResult(
+        protocolVersion=types.LATEST_PROTOCOL_VERSION,
+        capabilities=types.ServerCapabilities(),
+        serverInfo=types.Implementation(name="fake", version="0.0.0"),
+    )
+    response = types.JSONRPCResponse(
+        jsonrpc="2.0", id=initialize.id, result=result.model_dump(by_alias=True, mode="json", exclude_none=True)
+    )
+    await client_send.send(SessionMessage(types.JSONRPCMessage(response)))
+    await server_recv.receive()  # notifications/initialized
+
+
+def _sampling_request(request_id: int) -> Any:
+    from mcp.shared.message import SessionMessage
+
+    params = types.CreateMessageRequestParams(messages=[], maxTokens=1).model_dump(
+        by_alias=True, mode="json", exclude_none=True
+    )
+    request = types.JSONRPCRequest(jsonrpc="2.0", id=request_id, method="sampling/createMessage", params=params)
+    return SessionMessage(types.JSONRPCMessage(request))
+
+
+@pytest.mark.anyio
+async def test_sampling_concurrency_answers_requests_in_parallel() -> None:
+    from mcp.shared.message import SessionMessage
+
+    to_client_send, to_client_recv = anyio.create_memory_object_stream[SessionMessage](10)
+    to_server_send, to_server_recv = anyio.create_memory_object_stream[SessionMessage](10)
+
+    in_flight = 0
+    both_started = anyio.Event()
+
+    async def sampling_handler(ctx: Any, params: types.CreateMessageRequestParams) -> types.CreateMessageResult:
+        nonlocal in_flight
+        in_flight += 1
+        if in_flight == 2:
+            both_started.set()
+        # Serial dispatch would never let the second request start.
+        with anyio.fail_after(1):
+            await both_started.wait()
+        content = types.TextContent(type="text", text="ok")
+        return types.CreateMessageResult(role="assistant", content=content, model="stub")
+
+    replies: list[types.JSONRPCMessage] = []
+    answered = anyio.Event()
+
+    async def fake_server() -> None:
+        await _fake_handshake(to_server_recv, to_client_send)
+        for request_id in (1, 2):
+            await to_client_send.send(_sampling_request(request_id))
+        for _ in range(2):
+            replies.append((await to_server_recv.receive()).message)
+        answered.set()
+
+    config = ClientCapabilitiesConfig(sampling=sampling_handler, sampling_concurrency=2)
+    with anyio.fail_after(5):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(fake_server)
+            async with MCPClient(to_client_recv, to_server_send, capabilities=config):
+                await answered.wait()
+
+    assert sorted(reply.root.id for reply in replies) == [1, 2]
+    assert all(isinstance(reply.root, types.JSONRPCResponse) for reply in replies)
+
+
+@pytest.mark.anyio
+async def test_sampling_concurrency_survives_invalid_handler_result() -> None:
+    from mcp.shared.message import SessionMessage
+
+    to_client_send, to_client_recv = anyio.create_memory_object_stream[SessionMessage](10)
+    to_server_send, to_server_recv = anyio.create_memory_object_stream[SessionMessage](10)
+
+    async def sampling_handler(ctx: Any, params: types.CreateMessageRequestParams) -> Any:
+        return 42
+
+    replies: list[types.JSONRPCMessage] = []
+    answered = anyio.Event()
+
+    async def fake_server() -> None:
+        await _fake_handshake(to_server_recv, to_client_send)
+        await to_client_send.send(_sampling_request(1))
+        replies.append((await to_server_recv.receive()).message)
+        answered.set()
+        ping = (await to_server_recv.receive()).message.root
+        pong = types.JSONRPCResponse(jsonrpc="2.0", id=ping.id, result={})
+        await to_client_send.send(SessionMessage(types.JSONRPCMessage(pong)))
+
+    config = ClientCapabilitiesConfig(sampling=sampling_handler, sampling_concurrency=4)
+    with anyio.fail_after(5):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(fake_server)
+            async with MCPClient(to_client_recv, to_server_send, capabilities=config) as client:
+                await answered.wait()
+                # The session is still usable after the bad result.
+                await client.ping()
+
+    (reply,) = replies
+    assert isinstance(reply.root, types.JSONRPCError)
+    assert reply.root.error.code == types.INTERNAL_ERROR
+
+
+@pytest.mark.anyio
+async def test_sampling_concurrency_honours_immediate_cancel() -> None:
+    from mcp.shared.message import SessionMessage
+
+    to_client_send, to_client_recv = anyio.create_memory_object_stream[SessionMessage](10)
+    to_server_send, to_server_recv = anyio.create_memory_object_stream[SessionMessage](10)
+
+    handler_cancelled = anyio.Event()
+
+    async def sampling_handler(ctx: Any, params: types.CreateMessageRequestParams) -> Any:
+        try:
+            await anyio.sleep_forever()
+        finally:
+            handler_cancelled.set()
+
+    replies: list[types.JSONRPCMessage] = []
+    answered = anyio.Event()
+
+    async def fake_server() -> None:
+        await _fake_handshake(to_server_recv, to_client_send)
+        cancel = types.JSONRPCNotification(
+            jsonrpc="2.0", method="notifications/cancelled", params={"requestId": 1, "reason": "user abort"}
+        )
+        # Queue both back to back so the cancel is read before the task would run.
+        await to_client_send.send(_sampling_request(1))
+        await to_client_send.send(SessionMessage(types.JSONRPCMessage(cancel)))
+        replies.append((await to_server_recv.receive()).message)
+        answered.set()
+
+    config = ClientCapabilitiesConfig(sampling=sampling_handler, sampling_concurrency=4)
+    with anyio.fail_after(5):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(fake_server)
+            async with MCPClient(to_client_recv, to_server_send, capabilities=config):
+                await answered.wait()
+                await handler_cancelled.wait()
+
+    (reply,) = replies
+    assert isinstance(reply.root, types.JSONRPCError)
+    assert reply.root.error.message == "Request cancelled"
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.mark.anyio
+async def test_token_bucket_delays_calls_beyond_burst(monkeypatch: pytest.MonkeyPatch) -> None:
+    from openmcp.client import core
+
+    clock = _FakeClock()
+    monkeypatch.setattr(core, "time", SimpleNamespace(monotonic=clock.monotonic))
+    monkeypatch.setattr(
+        core, "anyio", SimpleNamespace(sleep=clock.sleep, get_cancelled_exc_class=anyio.get_cancelled_exc_class)
+    )
+
+    bucket = core._TokenBucket(20.0, 2)
+    for _ in range(4):
+        await bucket.acquire()
+
+    # Burst admitted immediately, then one token every 1/20 s.
+    assert clock.sleeps == [pytest.approx(0.05), pytest.approx(0.05)]
+
+
+@pytest.mark.anyio
+async def test_token_bucket_refunds_cancelled_reservation(monkeypatch: pytest.MonkeyPatch) -> None:
+    from openmcp.client import core
+
+    clock = _FakeClock()
+    monkeypatch.setattr(core, "time", SimpleNamespace(monotonic=clock.monotonic))
+    bucket = core._TokenBucket(10.0, 1)
+    await bucket.acquire()  # spends the burst
+
+    with anyio.move_on_after(0.01):
+        await bucket.acquire()  # waits 0.1 s of fake time; real sleep is cancelled
+
+    monkeypatch.setattr(
+        core, "anyio", SimpleNamespace(sleep=clock.sleep, get_cancelled_exc_class=anyio.get_cancelled_exc_class)
+    )
+    await bucket.acquire()
+    # Without the refund the abandoned reservation would push this to 0.2 s.
+    assert clock.sleeps == [pytest.approx(0.1)]
+
+
+@pytest.mark.anyio
+async def test_sampling_rate_limit_wait_does_not_block_session() -> None:
+    from mcp.shared.message import SessionMessage
+
+    to_client_send, to_client_recv = anyio.create_memory_object_stream[SessionMessage](10)
+    to_server_send, to_server_recv = anyio.create_memory_object_stream[SessionMessage](10)
+
+    async def sampling_handler(ctx: Any, params: types.CreateMessageRequestParams) -> types.CreateMessageResult:
+        content = types.TextContent(type="text", text="ok")
+        return types.CreateMessageResult(role="assistant", content=content, model="stub")
+
+    replies: list[types.JSONRPCMessage] = []
+    first_answered = anyio.Event()
+
+    async def fake_server() -> None:
+        await _fake_handshake(to_server_recv, to_client_send)
+        await to_client_send.send(_sampling_request(1))
+        replies.append((await to_server_recv.receive()).message)
+        first_answered.set()
+        # The second request has to wait ~1000 s for a token.
+        await to_client_send.send(_sampling_request(2))
+        ping = (await to_server_recv.receive()).message.root
+        pong = types.JSONRPCResponse(jsonrpc="2.0", id=ping.id, result={})
+        await to_client_send.send(SessionMessage(types.JSONRPCMessage(pong)))
+
+    config = ClientCapabilitiesConfig(sampling=sampling_handler, sampling_rate_limit=0.001)
+    with anyio.fail_after(5):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(fake_server)
+            async with MCPClient(to_client_recv, to_server_send, capabilities=config) as client:
+                await first_answered.wait()
+                await client.ping()  # answered while sampling request 2 waits for its token
+
+    (reply,) = replies
+    assert isinstance(reply.root, types.JSONRPCResponse)
+
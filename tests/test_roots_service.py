@@ -105,6 +105,16 @@ async def test_pagination_and_versioning(tmp_path: Path) -> None:
         service.decode_cursor(session, cursor)
 
 
+def test_guard_rejects_sibling_sharing_name_prefix(tmp_path: Path) -> None:
+    root = tmp_path / "project"
+    guard = RootGuard((types.Root(uri=root.as_uri()),))
+
+    assert guard.within(root)
+    assert guard.within(root / "src" / "main.py")
+    assert not guard.within(tmp_path / "project-secrets" / "key.pem")
+    assert not guard.within(tmp_path)
+
+
 @pytest.mark.anyio
 async def test_symlink_outside_denied(tmp_path: Path) -> None:
     outside = tmp_path.parent / "outside.txt"
@@ -90,6 +90,35 @@ async def test_registering_outside_binding():
     assert result.structuredContent == {"result": 12}
 
 
+@pytest.mark.asyncio
+async def test_register_tools_rebuilds_registry_once(monkeypatch):
+    server = MCPServer("demo")
+
+    @tool(description="Add numbers")
+    def add(a: int, b: int) -> int:
+        return a + b
+
+    def subtract(a: int, b: int) -> int:
+        return a - b
+
+    refreshes = 0
+    original_refresh = server.tools._refresh_tools
+
+    def counting_refresh() -> None:
+        nonlocal refreshes
+        refreshes += 1
+        original_refresh()
+
+    monkeypatch.setattr(server.tools, "_refresh_tools", counting_refresh)
+
+    specs = server.register_tools([add, subtract])
+    assert [spec.name for spec in specs] == ["add", "subtract"]
+    assert refreshes == 1
+    assert {"add", "subtract"} <= set(server.tool_names)
+    result = await server.invoke_tool("subtract", a=5, b=2)
+    assert result.content[0].text == "3"
+
+
 @pytest.mark.asyncio
 async def test_serve_dispatch(monkeypatch):
     http_server = MCPServer("demo-http")
@@ -51,3 +51,34 @@ async def test_dynamic_server_requires_notification() -> None:
 
     await server.notify_tools_list_changed()
     assert server._tool_mutation_pending_notification is False
+
+
+@pytest.mark.anyio
+async def test_list_tools_reads_snapshot_when_registry_mutates_mid_listing() -> None:
+    server = _bootstrap_server(allow_dynamic=True)
+    armed = False
+
+    def enabled_and_mutating(_: MCPServer) -> bool:
+        nonlocal armed
+        if armed:
+            armed = False
+            with server.binding():
+
+                @tool()
+                def late() -> str:
+                    return "late"
+
+        return True
+
+    with server.binding():
+
+        @tool(enabled=enabled_and_mutating)
+        def gated() -> str:
+            return "gated"
+
+    armed = True
+    first = await server.tools.list_tools(None)
+    assert [t.name for t in first.tools] == ["ping", "gated"]
+
+    second = await server.tools.list_tools(None)
+    assert [t.name for t in second.tools] == ["ping", "gated", "late"]